@@ -1,14 +1,20 @@
+import asyncio
 import logging
+import time
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import StreamingResponse, HTMLResponse, FileResponse
+from fastapi.responses import StreamingResponse, HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from sonorium.theme import ThemeDefinition
+from sonorium.recording import RecordingMetadata, RecordingThemeInstance, PlaybackMode
 from sonorium.version import __version__
 from sonorium.obs import logger
+from sonorium.web.middleware import add_compression
 from fmtr.tools import api
+from fmtr.tools.iterator_tools import IndexList
 
 # Import ClientSonorium for type hints (replaces mqtt.Client)
 from typing import TYPE_CHECKING
@@ -31,6 +37,9 @@ STATIC_DIR = Path(__file__).parent / "web" / "static"
 PACKAGE_ROOT = Path(__file__).parent.parent
 LOGO_PATH = PACKAGE_ROOT / "logo.png"
 
+# How long an encoded /api/themes response is reused before rescanning
+THEMES_CACHE_TTL = 30.0
+
 
 class ApiSonorium(api.Base):
     TITLE = f'Sonorium {__version__} Streaming API'
@@ -52,6 +61,17 @@ class ApiSonorium(api.Base):
         self._mqtt_manager = None
         self._plugin_manager = None
         self._theme_metadata_manager = None
+
+        # Encoded /api/themes response as (monotonic timestamp, generation, instance revision, JSON bytes)
+        self._themes_cache: tuple[float, int, int, bytes] | None = None
+        # Bumped on every invalidation, so a scan that started before one isn't cached
+        self._themes_generation = 0
+
+        # Encode JSON responses with orjson for routes registered from here on
+        self.app.router.default_response_class = ORJSONResponse
+
+        # Compress JSON/HTML responses (hierarchy and debug payloads are large and repetitive)
+        add_compression(self.app)
         
         # Register startup event to initialize v2
         @self.app.on_event("startup")
@@ -264,6 +284,7 @@ class ApiSonorium(api.Base):
                 cycle_manager=self._cycle_manager,
                 plugin_manager=self._plugin_manager,
                 mqtt_manager=self._mqtt_manager,
+                on_themes_changed=self.invalidate_themes_cache,
             )
             self.app.include_router(api_router)
             
@@ -361,8 +382,6 @@ class ApiSonorium(api.Base):
         if not self._theme_metadata_manager:
             return
 
-        from sonorium.recording import PlaybackMode
-
         device = self.client.device
         if not device.themes:
             return
@@ -414,6 +433,8 @@ class ApiSonorium(api.Base):
         if self._cycle_manager:
             await self._cycle_manager.stop()
             logger.info("CycleManager stopped")
+        if self._state_store:
+            await self._state_store.flush()
 
     async def web_ui(self):
         """Serve the main web UI (v2 if available, else v1)."""
@@ -757,8 +778,30 @@ class ApiSonorium(api.Base):
 
         return None, None
 
+    def invalidate_themes_cache(self):
+        """Drop the cached /api/themes response after themes or their metadata change."""
+        self._themes_generation += 1
+        self._themes_cache = None
+
     async def list_themes(self):
         """List all available themes with full metadata from metadata.json files."""
+        # Track toggles from anywhere (MQTT, sessions, API) bump the instance revision
+        generation = self._themes_generation
+        revision = RecordingThemeInstance.revision
+        cached = self._themes_cache
+        if (cached and cached[1] == generation and cached[2] == revision
+                and time.monotonic() - cached[0] < THEMES_CACHE_TTL):
+            return Response(content=cached[3], media_type="application/json")
+
+        # Theme listing walks the media folders; keep it off the event loop
+        content = orjson.dumps(await asyncio.to_thread(self._build_themes_list))
+        # Only cache if nothing was invalidated while scanning
+        if generation == self._themes_generation and revision == RecordingThemeInstance.revision:
+            self._themes_cache = (time.monotonic(), generation, revision, content)
+        return Response(content=content, media_type="application/json")
+
+    def _build_themes_list(self) -> list[dict]:
+        """Scan loaded themes and empty theme folders into list_themes payloads."""
         device = self.client.device
         themes = []
         seen_folders = set()
@@ -766,7 +809,7 @@ class ApiSonorium(api.Base):
 
         # First, add themes loaded by the device (have audio files)
         for theme in device.themes:
-            enabled_count = sum(1 for i in theme.instances if i.is_enabled)
+            enabled_count = theme.enabled_count
 
             # Get metadata from metadata manager or read from file
             theme_folder = self._find_theme_folder(theme.id)
@@ -850,10 +893,6 @@ class ApiSonorium(api.Base):
 
     async def refresh_themes(self):
         """Rescan theme folders and reload themes."""
-        from sonorium.theme import ThemeDefinition
-        from sonorium.recording import RecordingMetadata, PlaybackMode
-        from fmtr.tools.iterator_tools import IndexList
-
         device = self.client.device
         path_audio = device.path_audio
         audio_extensions = ['.mp3', '.wav', '.flac', '.ogg']
@@ -954,6 +993,7 @@ class ApiSonorium(api.Base):
                     inst.exclusive = False
 
         logger.info(f'Theme refresh complete: {len(device.themes)} themes loaded')
+        self.invalidate_themes_cache()
 
         # Update session manager's theme reference
         if self._session_manager:
@@ -1082,7 +1122,7 @@ class ApiSonorium(api.Base):
             return {"error": "Theme not found"}
 
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception:
             return {"error": "Invalid JSON body"}
 
@@ -1118,7 +1158,7 @@ class ApiSonorium(api.Base):
             return {"error": "Theme not found"}
 
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception:
             return {"error": "Invalid JSON body"}
 
@@ -1143,6 +1183,7 @@ class ApiSonorium(api.Base):
 
         # Persist to metadata.json
         self._save_track_setting_to_metadata(theme_id, track_name, muted=muted)
+        self.invalidate_themes_cache()
 
         return {"status": "ok", "track": track_name, "muted": muted}
 
@@ -1156,7 +1197,7 @@ class ApiSonorium(api.Base):
             return {"error": "Theme not found"}
 
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception:
             return {"error": "Invalid JSON body"}
 
@@ -1194,14 +1235,12 @@ class ApiSonorium(api.Base):
         - sparse: Play once, then silence for interval based on presence
         - presence: Fade in/out based on presence value
         """
-        from sonorium.recording import PlaybackMode
-
         theme, _ = self._get_theme_by_id(theme_id)
         if not theme:
             return {"error": "Theme not found"}
 
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception:
             return {"error": "Invalid JSON body"}
 
@@ -1241,7 +1280,7 @@ class ApiSonorium(api.Base):
             return {"error": "Theme not found"}
 
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception:
             return {"error": "Invalid JSON body"}
 
@@ -1281,7 +1320,7 @@ class ApiSonorium(api.Base):
             return {"error": "Theme not found"}
 
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception:
             return {"error": "Invalid JSON body"}
 
@@ -1311,9 +1350,6 @@ class ApiSonorium(api.Base):
 
     async def reset_theme_tracks(self, theme_id: str):
         """Reset all track settings to defaults for a theme."""
-        from sonorium.recording import PlaybackMode
-        from sonorium.core.theme_metadata import TrackSettings
-
         theme, _ = self._get_theme_by_id(theme_id)
         if not theme:
             return {"error": "Theme not found"}
@@ -1337,6 +1373,7 @@ class ApiSonorium(api.Base):
                     metadata.tracks = {}
                     self._theme_metadata_manager.save_metadata(metadata.id, metadata)
 
+        self.invalidate_themes_cache()
         return {"status": "ok", "theme_id": theme_id}
 
     # ==================== Preset API ====================
@@ -1362,8 +1399,6 @@ class ApiSonorium(api.Base):
 
     def _apply_preset_to_theme(self, theme_id: str, preset_tracks: dict) -> bool:
         """Apply preset track settings to a theme. Returns True on success."""
-        from sonorium.recording import PlaybackMode
-
         # Use _get_theme_by_id to handle both UUID-based and folder-based IDs
         theme, theme_folder = self._get_theme_by_id(theme_id)
         if not theme:
@@ -1446,7 +1481,7 @@ class ApiSonorium(api.Base):
 
         # Get name from request body
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
             name = body.get("name")
         except Exception:
             name = None
@@ -1541,6 +1576,7 @@ class ApiSonorium(api.Base):
 
                 if not self._apply_preset_to_theme(theme_id, tracks):
                     raise HTTPException(status_code=500, detail="Failed to apply preset")
+                self.invalidate_themes_cache()
 
                 return {
                     "status": "ok",
@@ -1561,6 +1597,7 @@ class ApiSonorium(api.Base):
 
         if not self._apply_preset_to_theme(theme_id, tracks):
             raise HTTPException(status_code=500, detail="Failed to apply preset")
+        self.invalidate_themes_cache()
 
         return {
             "status": "ok",
@@ -1715,7 +1752,7 @@ class ApiSonorium(api.Base):
 
         # Get preset_json and name from request body
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
             preset_json = body.get("preset_json")
             name = body.get("name")
         except Exception:
@@ -1881,7 +1918,7 @@ class ApiSonorium(api.Base):
         """Rename a theme (updates display name in metadata.json, not the folder)."""
         # Get new name from request body
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
             new_name = body.get("name", "").strip()
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid request body")
@@ -1907,6 +1944,7 @@ class ApiSonorium(api.Base):
         metadata.name = new_name
         if not self._theme_metadata_manager.save_metadata(metadata.id, metadata):
             raise HTTPException(status_code=500, detail="Failed to save metadata")
+        self.invalidate_themes_cache()
 
         logger.info(f"Renamed theme '{old_name}' to '{new_name}' (folder: {folder.name})")
 
@@ -1921,7 +1959,7 @@ class ApiSonorium(api.Base):
         """Rename a preset."""
         # Get new name from request body
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
             new_name = body.get("name", "").strip()
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid request body")
@@ -1992,6 +2030,7 @@ class ApiSonorium(api.Base):
             if cached_metadata:
                 cached_metadata.is_favorite = is_favorite
 
+        self.invalidate_themes_cache()
         return {"theme_id": theme_id, "is_favorite": is_favorite}
 
     async def list_categories(self):
@@ -2009,7 +2048,7 @@ class ApiSonorium(api.Base):
             return {"error": "State not available"}
 
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception:
             return {"error": "Invalid JSON body"}
 
@@ -2047,13 +2086,14 @@ class ApiSonorium(api.Base):
                 assignments[theme_id].remove(category_name)
 
         self._state_store.save()
+        self.invalidate_themes_cache()
 
         return {"status": "ok", "deleted": category_name, "categories": categories}
 
     async def set_theme_categories(self, theme_id: str, request: Request):
         """Set categories for a theme (stored in metadata.json)."""
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception:
             return {"error": "Invalid JSON body"}
 
@@ -2085,6 +2125,7 @@ class ApiSonorium(api.Base):
             if cached_metadata:
                 cached_metadata.categories = new_categories
 
+        self.invalidate_themes_cache()
         return {"theme_id": theme_id, "categories": new_categories}
 
     async def list_channels(self):
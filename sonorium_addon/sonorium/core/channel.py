@@ -75,6 +75,9 @@ class Channel:
     # Active client count (for resource management)
     _client_count: int = 0
 
+    # Revision - increments whenever to_dict() output may change
+    _revision: int = 0
+
     # Lock for thread-safe operations
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
@@ -131,6 +134,11 @@ class Channel:
         """Get current theme version (for change detection)."""
         return self._theme_version
 
+    @property
+    def revision(self) -> int:
+        """Get current state revision (for API response caching)."""
+        return self._revision
+
     @property
     def is_active(self) -> bool:
         """Check if channel has connected clients."""
@@ -155,6 +163,7 @@ class Channel:
             logger.info(f"Channel {self.id}: Changing theme from '{old_theme}' to '{theme.name}'")
 
             self._theme_version += 1
+            self._revision += 1
 
             if self._generator_running:
                 # Queue the theme change - generator thread will handle crossfade
@@ -297,6 +306,7 @@ class Channel:
 
         # Switch to new theme
         self._current_theme = theme
+        self._revision += 1
         self._theme_stream = new_stream
         self._chunk_generator = new_generator
 
@@ -312,6 +322,7 @@ class Channel:
             self._chunk_generator = None
             self._pending_theme = None
             self._theme_version += 1
+            self._revision += 1
             self.state = ChannelState.IDLE
             self._broadcast_buffer.clear()
 
@@ -322,11 +333,13 @@ class Channel:
     def client_connected(self) -> None:
         """Track a new client connection."""
         self._client_count += 1
+        self._revision += 1
         logger.info(f"Channel {self.id}: Client connected ({self._client_count} total)")
 
     def client_disconnected(self) -> None:
         """Track a client disconnection."""
         self._client_count = max(0, self._client_count - 1)
+        self._revision += 1
         logger.info(f"Channel {self.id}: Client disconnected ({self._client_count} remaining)")
 
     def get_current_sequence(self) -> int:
@@ -439,6 +452,11 @@ class ChannelManager:
         """Get channels that are currently playing."""
         return [c for c in self._channels.values() if c.state == ChannelState.PLAYING]
 
+    @property
+    def revision(self) -> int:
+        """Combined revision of all channels; changes whenever list_channels() may."""
+        return sum(c.revision for c in self._channels.values())
+
     def list_channels(self) -> list[dict]:
         """Get all channels as serialized dicts for API."""
         return [c.to_dict() for c in self._channels.values()]
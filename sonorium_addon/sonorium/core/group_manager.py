@@ -31,6 +31,9 @@ class GroupManager:
     def __init__(self, state_store: StateStore, ha_registry: HARegistry):
         self.state = state_store
         self.registry = ha_registry
+
+        # Bumped on every group mutation; used for HTTP ETags
+        self.revision = 0
     
     # --- CRUD Operations ---
     
@@ -90,6 +93,7 @@ class GroupManager:
         
         # Store and save
         self.state.speaker_groups[group_id] = group
+        self.revision += 1
         self.state.save()
         
         resolved = self.resolve(group)
@@ -182,6 +186,7 @@ class GroupManager:
             group.exclude_speakers = exclude_speakers
         
         group.touch()
+        self.revision += 1
         self.state.save()
         
         logger.info(f"  Updated group '{group.name}'")
@@ -202,6 +207,7 @@ class GroupManager:
             return False
         
         group = self.state.speaker_groups.pop(group_id)
+        self.revision += 1
         self.state.save()
         
         logger.info(f"  Deleted group '{group.name}'")
@@ -270,6 +276,23 @@ class GroupManager:
         """Get the number of resolved speakers in a group."""
         return len(self.resolve(group))
     
+    def resolve_full(self, group: SpeakerGroup) -> tuple[list[str], int, str]:
+        """
+        Resolve a group's speakers, count and summary in one call.
+        
+        The selection is resolved once and the count taken from the result.
+        """
+        speakers = self.resolve(group)
+        return speakers, len(speakers), self.get_summary(group)
+    
+    def bulk_resolve(self, groups: list[SpeakerGroup]) -> list[tuple[list[str], int, str]]:
+        """
+        Resolve several groups at once.
+        
+        Returns one resolve_full() tuple per group, in order.
+        """
+        return [self.resolve_full(group) for group in groups]
+    
     # --- Validation ---
     
     def get_sessions_using_group(self, group_id: str) -> list[str]:
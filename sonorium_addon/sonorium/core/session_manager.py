@@ -12,6 +12,7 @@ Handles CRUD operations for playback sessions, including:
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from typing import Optional, TYPE_CHECKING
 
@@ -65,6 +66,12 @@ class SessionManager:
 
         # Track which session is using which channel: session_id -> channel_id
         self._session_channels: dict[str, int] = {}
+
+        # Resolved speakers/summary per session: session_id -> (key, speakers, summary)
+        self._resolution_cache: dict[str, tuple[tuple, list[str], str]] = {}
+
+        # Bumped on every session mutation; used for HTTP ETags
+        self.revision = 0
     
     def set_media_controller(self, controller: HAMediaController):
         """Set the media controller (for deferred initialization)."""
@@ -422,6 +429,7 @@ class SessionManager:
         
         # Store and save
         self.state.sessions[session_id] = session
+        self.revision += 1
         self.state.save()
         
         logger.info(f"  Created session '{session.name}' ({session_id})")
@@ -506,6 +514,7 @@ class SessionManager:
                 session.adhoc_selection, group
             )
 
+        self.revision += 1
         self.state.save()
 
         # If session is playing and theme changed, trigger crossfade
@@ -558,16 +567,23 @@ class SessionManager:
         stream_url = self.get_stream_url(session)
         volume_level = session.volume / 100.0
 
-        # Stop removed speakers
-        if removed_speakers:
+        async def stop_removed():
             logger.info(f"  Stopping {len(removed_speakers)} removed speaker(s)")
             await self.media_controller.stop_multi(list(removed_speakers))
 
-        # Start added speakers
-        if added_speakers:
+        async def start_added():
             logger.info(f"  Starting {len(added_speakers)} added speaker(s)")
             await self.media_controller.play_media_multi(list(added_speakers), stream_url)
             await self.media_controller.set_volume_multi(list(added_speakers), volume_level)
+
+        # The two sets are disjoint, so removals and additions can run side by side
+        # (each *_multi call already fans out per speaker). If one side fails the
+        # task group cancels the other rather than leaving it running unobserved.
+        async with asyncio.TaskGroup() as tg:
+            if removed_speakers:
+                tg.create_task(stop_removed())
+            if added_speakers:
+                tg.create_task(start_added())
     
     def update_cycle_config(
         self,
@@ -599,6 +615,7 @@ class SessionManager:
         if theme_ids is not None:
             session.cycle_config.theme_ids = theme_ids
         
+        self.revision += 1
         self.state.save()
         
         # Reset cycle timer if cycling was just enabled
@@ -641,6 +658,8 @@ class SessionManager:
         self._release_channel(session_id)
         
         session = self.state.sessions.pop(session_id)
+        self._resolution_cache.pop(session_id, None)
+        self.revision += 1
         self.state.save()
         
         logger.info(f"  Deleted session '{session.name}'")
@@ -648,12 +667,43 @@ class SessionManager:
     
     # --- Speaker Resolution ---
     
+    def _resolution_key(self, session: Session) -> tuple:
+        """
+        Build the cache key for a session's speaker resolution.
+        
+        Covers the registry hierarchy version, the group (edited in place, so
+        its updated_at stamp acts as its version) and the ad-hoc selection
+        (replaced on change, compared by value).
+        """
+        group = self.state.speaker_groups.get(session.speaker_group_id) if session.speaker_group_id else None
+        return (
+            self.registry.version,
+            session.speaker_group_id,
+            group.updated_at if group else None,
+            session.adhoc_selection,
+        )
+    
+    def _get_resolution(self, session: Session) -> tuple[list[str], str]:
+        """Get (speakers, summary) for a session, recomputing only when inputs changed."""
+        key = self._resolution_key(session)
+        cached = self._resolution_cache.get(session.id)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        speakers = self._resolve_speakers(session)
+        summary = self._build_speaker_summary(session, speakers)
+        self._resolution_cache[session.id] = (key, speakers, summary)
+        return speakers, summary
+    
     def get_resolved_speakers(self, session: Session) -> list[str]:
         """
         Get the list of speaker entity_ids for a session.
         
         Resolves speaker group or ad-hoc selection to final list.
         """
+        return list(self._get_resolution(session)[0])
+    
+    def _resolve_speakers(self, session: Session) -> list[str]:
+        """Resolve speaker group or ad-hoc selection to final list (uncached)."""
         if session.speaker_group_id:
             group = self.state.speaker_groups.get(session.speaker_group_id)
             if group:
@@ -686,8 +736,10 @@ class SessionManager:
         - "Bedroom Level (2 excluded)"
         - "Office Echo"
         """
-        speakers = self.get_resolved_speakers(session)
-        
+        return self._get_resolution(session)[1]
+    
+    def _build_speaker_summary(self, session: Session, speakers: list[str]) -> str:
+        """Build the speaker summary from already-resolved speakers (uncached)."""
         if not speakers:
             return "No speakers"
         
@@ -759,6 +811,7 @@ class SessionManager:
         # Mark as playing immediately (optimistic update)
         session.is_playing = True
         session.mark_played()
+        self.revision += 1
         self.state.save()
         
         # Initialize cycle timer if enabled
@@ -806,6 +859,7 @@ class SessionManager:
             await self.media_controller.pause_multi(speakers)
         
         session.is_playing = False
+        self.revision += 1
         self.state.save()
         
         logger.info(f"  Paused session '{session.name}'")
@@ -835,6 +889,7 @@ class SessionManager:
         self._release_channel(session_id)
         
         session.is_playing = False
+        self.revision += 1
         self.state.save()
         
         logger.info(f"  Stopped session '{session.name}'")
@@ -858,6 +913,7 @@ class SessionManager:
             return False
         
         session.volume = max(0, min(100, volume))
+        self.revision += 1
         self.state.save()
         
         # If playing, update volume on speakers
@@ -877,9 +933,21 @@ class SessionManager:
         Returns:
             Number of sessions stopped
         """
-        count = 0
-        for session in self.state.sessions.values():
-            if session.is_playing:
-                await self.stop(session.id)
-                count += 1
-        return count
\ No newline at end of file
+        playing = [s.id for s in self.state.sessions.values() if s.is_playing]
+        if not playing:
+            return 0
+
+        semaphore = asyncio.Semaphore(max(1, self.state.settings.max_concurrent_operations))
+
+        async def stop_bounded(session_id: str) -> bool:
+            # Failures are logged here so one session can't cancel the others
+            async with semaphore:
+                try:
+                    return await self.stop(session_id)
+                except Exception as e:
+                    logger.error(f"  Failed to stop session {session_id}: {e}")
+                    return False
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(stop_bounded(session_id)) for session_id in playing]
+        return sum(task.result() for task in tasks)
\ No newline at end of file
@@ -7,7 +7,10 @@ State is stored in /config/sonorium/state.json to survive addon updates.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import threading
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
@@ -21,6 +24,12 @@ from sonorium.obs import logger
 DEFAULT_STATE_DIR = Path("/config/sonorium")
 DEFAULT_STATE_FILE = DEFAULT_STATE_DIR / "state.json"
 
+# Delay used to coalesce bursts of changes into a single state write
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+# How long journaled settings changes may wait before being folded into state.json
+JOURNAL_COMPACT_SECONDS = 60.0
+
 
 class NameSource(str, Enum):
     """How a session name was determined."""
@@ -30,7 +39,7 @@ class NameSource(str, Enum):
     CUSTOM = "custom"              # User-defined name
 
 
-@dataclass
+@dataclass(slots=True)
 class CycleConfig:
     """
     Theme cycling configuration for a session.
@@ -84,6 +93,9 @@ class SonoriumSettings:
     default_cycle_interval: int = 60  # minutes
     default_cycle_randomize: bool = False
 
+    # Upper bound on sessions handled concurrently by bulk operations (e.g. stop all)
+    max_concurrent_operations: int = 8
+
     # Speaker availability - only these speakers are visible/targetable in Sonorium
     # Empty list = all speakers enabled (backwards compatibility)
     enabled_speakers: list[str] = field(default_factory=list)
@@ -136,6 +148,10 @@ class SonoriumSettings:
     # Enabled plugins list (by plugin_id)
     enabled_plugins: list[str] = field(default_factory=list)
 
+    # Bumped on every settings change made through the API; clients compare it to
+    # detect changes and send it back as If-Match to guard their writes
+    version: int = 0
+
     def to_dict(self) -> dict:
         return asdict(self)
     
@@ -144,7 +160,7 @@ class SonoriumSettings:
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class SpeakerSelection:
     """
     Inline speaker selection (not saved as a group).
@@ -169,7 +185,14 @@ class SpeakerSelection:
         )
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Flat lists of IDs - a shallow copy per field avoids asdict's recursive walk
+        return {
+            "include_floors": list(self.include_floors),
+            "include_areas": list(self.include_areas),
+            "include_speakers": list(self.include_speakers),
+            "exclude_areas": list(self.exclude_areas),
+            "exclude_speakers": list(self.exclude_speakers),
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> SpeakerSelection:
@@ -357,18 +380,43 @@ class SonoriumState:
 class StateStore:
     """
     Manages loading and saving of Sonorium state.
+
+    Settings changes can be appended to a small journal next to the state
+    file instead of rewriting the whole state. Each save first rotates the
+    journal into a numbered segment; segments are deleted once a snapshot with
+    an equal or higher number is on disk, and any left over are replayed on load.
     """
     
     def __init__(self, state_file: Path = DEFAULT_STATE_FILE):
         self.state_file = state_file
+        self.journal_file = state_file.with_suffix(".journal")
         self.state: SonoriumState = SonoriumState()
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_deadline = 0.0
+        self._write_lock = threading.Lock()
+
+        # Snapshots are numbered as they are taken (journal segments share the
+        # number); a snapshot older than the one already on disk is dropped, so
+        # overlapping saves can't regress it
+        self._snapshot_seq = 0
+        self._written_seq = 0
+
+        # Changes reported through schedule_save(), and the count the latest
+        # snapshot covers; they differ while state is dirty
+        self._changes = 0
+        self._snapshot_changes = 0
     
     @logger.instrument("Loading state from {self.state_file}...")
     def load(self) -> SonoriumState:
         """Load state from disk, or create default if not exists."""
+        # Number new segments after any left over from a previous run
+        self._snapshot_seq = max((seq for seq, _ in self._segments()), default=0)
+
         if not self.state_file.exists():
             logger.info("  No existing state file, using defaults")
             self.state = SonoriumState()
+            if self._replay_journal():
+                self.save()
             return self.state
 
         try:
@@ -387,23 +435,186 @@ class StateStore:
             logger.error(f"  Failed to load state: {e}")
             self.state = SonoriumState()
 
+        if self._replay_journal():
+            self.save()
+
         return self.state
+
+    def _replay_journal(self) -> int:
+        """Apply journaled settings changes on top of loaded state. Returns records applied."""
+        settings = self.state.settings
+        applied = 0
+        paths = [path for _, path in self._segments()] + [self.journal_file]
+        for path in paths:
+            if not path.exists():
+                continue
+            try:
+                lines = path.read_text().splitlines()
+            except Exception as e:
+                logger.error(f"  Failed to read settings journal {path}: {e}")
+                continue
+            for line in lines:
+                try:
+                    changes = json.loads(line)
+                except ValueError:
+                    continue  # Torn final record from an interrupted append
+                for key, value in changes.items():
+                    if hasattr(settings, key):
+                        setattr(settings, key, value)
+                applied += 1
+        if applied:
+            logger.info(f"  Replayed {applied} journaled settings change(s)")
+        return applied
     
     @logger.instrument("Saving state to {self.state_file}...")
     def save(self):
         """Persist state to disk."""
+        self._write(*self._snapshot())
+
+    async def save_async(self):
+        """
+        Persist state without blocking the event loop.
+
+        The snapshot is taken on the loop so state cannot change mid-dump; only
+        the file write runs in a worker thread.
+        """
+        await asyncio.to_thread(self._write, *self._snapshot())
+
+    def _snapshot(self) -> tuple[int, str]:
+        """
+        Serialize current state, number it and set the journal aside, in one step.
+
+        Returns (sequence number, text). Nothing can run in between, so a higher
+        number always means newer state, and every change journaled into segment
+        `seq` is already in the text.
+        """
+        text = self._serialize()
+        self._snapshot_changes = self._changes
+        self._snapshot_seq += 1
+        seq = self._snapshot_seq
+        self._rotate_journal(seq)
+        return seq, text
+
+    def _serialize(self) -> str:
+        """Serialize current state with pretty formatting."""
+        return json.dumps(self.state.to_dict(), indent=2)
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.journal_file.with_name(f"{self.journal_file.name}.{seq}")
+
+    def _segments(self) -> list[tuple[int, Path]]:
+        """Rotated journal segments as (sequence number, path), oldest first."""
+        segments = []
+        for path in self.journal_file.parent.glob(f"{self.journal_file.name}.*"):
+            suffix = path.name.rsplit(".", 1)[1]
+            if suffix.isdigit():
+                segments.append((int(suffix), path))
+        return sorted(segments)
+
+    def _rotate_journal(self, seq: int):
+        """
+        Set the active journal aside as segment `seq`, to be superseded by snapshot `seq`.
+
+        A single rename, so it doesn't wait for the write lock: an append racing
+        it either lands in the segment (its change was made before the snapshot
+        was serialized) or starts a fresh journal.
+        """
         try:
-            # Ensure directory exists
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write with pretty formatting
-            data = self.state.to_dict()
-            self.state_file.write_text(json.dumps(data, indent=2))
-            
-            logger.info(f"  Saved {len(self.state.sessions)} sessions, {len(self.state.speaker_groups)} groups")
-        except Exception as e:
-            logger.error(f"  Failed to save state: {e}")
-            raise
+            self.journal_file.replace(self._segment_path(seq))
+        except FileNotFoundError:
+            pass
+
+    def _write(self, seq: int, text: str):
+        """Write serialized state to disk (one writer at a time, newest snapshot wins)."""
+        with self._write_lock:
+            if seq < self._written_seq:
+                return  # A newer snapshot is already on disk
+            try:
+                # Ensure directory exists
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                self.state_file.write_text(text)
+                self._written_seq = seq
+
+                # Segments up to this snapshot are folded into it; newer ones stay
+                for segment_seq, path in self._segments():
+                    if segment_seq <= seq:
+                        path.unlink(missing_ok=True)
+                
+                logger.info(f"  Saved {len(self.state.sessions)} sessions, {len(self.state.speaker_groups)} groups")
+            except Exception as e:
+                logger.error(f"  Failed to save state: {e}")
+                raise
+    
+    async def append_settings(self, changes: dict):
+        """
+        Durably record changed settings without rewriting the state file.
+
+        Appends one JSON line to the journal and fsyncs it; a full save is
+        scheduled to fold the journal back into the state file later.
+        """
+        if not changes:
+            return
+        await asyncio.to_thread(self._append_journal, json.dumps(changes) + "\n")
+        self.schedule_save(JOURNAL_COMPACT_SECONDS)
+
+    def _append_journal(self, line: str):
+        with self._write_lock:
+            try:
+                self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+                with self.journal_file.open("a") as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                logger.error(f"  Failed to journal settings: {e}")
+                raise
+
+    def schedule_save(self, delay: float = SAVE_DEBOUNCE_SECONDS):
+        """
+        Persist state shortly, off the request path.
+
+        Changes made while a save is pending are picked up by that save, so a
+        burst of updates results in a single write. A pending save is only
+        replaced if the new request wants to write sooner. Must be called from
+        within the running event loop.
+        """
+        self._changes += 1
+        self._schedule(delay)
+
+    def _schedule(self, delay: float):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay
+        if self._save_task and not self._save_task.done():
+            if self._save_deadline <= deadline:
+                return
+            # Safe even mid-write: the write lock keeps file writes serialized
+            self._save_task.cancel()
+        self._save_deadline = deadline
+        self._save_task = loop.create_task(self._delayed_save(delay))
+
+    async def _delayed_save(self, delay: float):
+        await asyncio.sleep(delay)
+        try:
+            await self.save_async()
+        except Exception:
+            pass  # Already logged by _write()
+        if self._changes != self._snapshot_changes:
+            # Changes reported while the write ran found this save already past
+            # its snapshot (and deferred to it); save again for them
+            self._save_task = None
+            self._schedule(SAVE_DEBOUNCE_SECONDS)
+
+    async def flush(self):
+        """Write any unsaved changes immediately (e.g. on shutdown)."""
+        task = self._save_task
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._changes != self._snapshot_changes:
+            self.save()
     
     # Convenience accessors
     @property
@@ -15,9 +15,14 @@ import json
 from dataclasses import dataclass, field
 from typing import Optional
 
+import orjson
 from fmtr.tools import http
 from sonorium.obs import logger
 
+
+# Maximum memoized resolve_selection() results per hierarchy version
+RESOLVE_CACHE_MAX = 256
+
 # Try to import websockets, fall back gracefully if not available
 try:
     import websockets
@@ -141,6 +146,17 @@ class HARegistry:
         self._areas: dict[str, Area] = {}
         self._speakers: dict[str, Speaker] = {}
         self._hierarchy: Optional[SpeakerHierarchy] = None
+
+        # Bumped whenever the hierarchy changes, so callers can cache derived data
+        self.version = 0
+
+        # Encoded JSON for API responses as (version, bytes), rebuilt lazily
+        self._hierarchy_json: Optional[tuple[int, bytes]] = None
+        self._speakers_json: Optional[tuple[int, bytes]] = None
+
+        # resolve_selection() results for the current version, keyed by frozensets
+        self._resolve_cache: dict[tuple, tuple[str, ...]] = {}
+        self._resolve_cache_version = -1
     
     def _get(self, endpoint: str) -> dict | list | None:
         """Make GET request to HA API."""
@@ -565,6 +581,7 @@ class HARegistry:
         hierarchy.unassigned_areas.sort(key=lambda a: a.name)
         
         self._hierarchy = hierarchy
+        self.version += 1
 
         total_speakers = len(hierarchy.get_all_speakers())
         logger.info(f"  Hierarchy complete: {len(hierarchy.floors)} floors, {len(hierarchy.unassigned_areas)} unassigned areas, {len(hierarchy.unassigned_speakers)} unassigned speakers, {total_speakers} total speakers")
@@ -621,6 +638,7 @@ class HARegistry:
 
         # Re-sort unassigned areas
         hierarchy.unassigned_areas.sort(key=lambda a: a.name)
+        self.version += 1
 
         return hierarchy
 
@@ -680,6 +698,23 @@ class HARegistry:
         """Get hierarchy as a dictionary for API responses."""
         return self.hierarchy.to_dict()
 
+    @property
+    def hierarchy_json(self) -> bytes:
+        """Get hierarchy as encoded JSON, re-encoded only when the version changes."""
+        hierarchy = self.hierarchy  # May refresh (and bump the version) on first use
+        if self._hierarchy_json is None or self._hierarchy_json[0] != self.version:
+            self._hierarchy_json = (self.version, orjson.dumps(hierarchy.to_dict()))
+        return self._hierarchy_json[1]
+
+    @property
+    def speakers_json(self) -> bytes:
+        """Get the flat speaker list as encoded JSON, re-encoded only when the version changes."""
+        hierarchy = self.hierarchy
+        if self._speakers_json is None or self._speakers_json[0] != self.version:
+            speakers = [s.to_dict() for s in hierarchy.get_all_speakers()]
+            self._speakers_json = (self.version, orjson.dumps(speakers))
+        return self._speakers_json[1]
+
     def get_all_speaker_ids(self) -> list[str]:
         """Get all speaker entity IDs as a flat list."""
         return [s.entity_id for s in self.hierarchy.get_all_speakers()]
@@ -700,7 +735,26 @@ class HARegistry:
         5. Remove all speakers from excluded areas
         6. Remove individually excluded speakers
         7. Return sorted list
+
+        Results are memoized per hierarchy version; selection order and
+        duplicates don't affect the result, so lists are keyed as frozensets.
         """
+        self.hierarchy  # May refresh (and bump the version) on first use
+        if self._resolve_cache_version != self.version:
+            self._resolve_cache.clear()
+            self._resolve_cache_version = self.version
+
+        key = (
+            frozenset(include_floors or ()),
+            frozenset(include_areas or ()),
+            frozenset(include_speakers or ()),
+            frozenset(exclude_areas or ()),
+            frozenset(exclude_speakers or ()),
+        )
+        cached = self._resolve_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         speakers = set()
         
         # Additions
@@ -717,8 +771,12 @@ class HARegistry:
             speakers -= set(self.get_speakers_in_area(area_id))
         
         speakers -= set(exclude_speakers or [])
-        
-        return sorted(list(speakers))
+
+        if len(self._resolve_cache) >= RESOLVE_CACHE_MAX:
+            self._resolve_cache.clear()
+        result = sorted(speakers)
+        self._resolve_cache[key] = tuple(result)
+        return result
 
 
 # Factory function to create registry from supervisor
@@ -256,16 +256,37 @@ class RecordingThemeInstance:
     Every theme gets one of these for each recording.
     """
 
+    # Bumped whenever any instance is enabled/disabled, so views rendered from the
+    # enabled flags (e.g. the legacy web UI) can tell when they are stale.
+    # The parent theme's enabled_count is kept in step by the same setter.
+    revision = 0
+
     def __init__(self, meta: RecordingMetadata, theme=None):
         self.meta = meta
         self.theme = theme  # Reference to parent ThemeDefinition for threshold access
         self.volume = 1.0  # Amplitude multiplier (keep at 1.0 for now)
         self.presence = 1.0  # How often this track plays: 1.0 = always, 0.5 = half the time, 0 = never
+        self._is_enabled = False
         self.is_enabled = True  # Master enable/disable (mute)
         self.crossfade_enabled = True  # Enable crossfade looping by default
         self.playback_mode = PlaybackMode.AUTO  # How playback/looping is handled
         self.exclusive = False  # If True, only one exclusive track can play at a time
 
+    @property
+    def is_enabled(self) -> bool:
+        return self._is_enabled
+
+    @is_enabled.setter
+    def is_enabled(self, value: bool):
+        value = bool(value)
+        if value == self._is_enabled:
+            return
+        self._is_enabled = value
+        if self.theme is not None:
+            self.theme.enabled_count += 1 if value else -1
+            self.theme.revision += 1
+        RecordingThemeInstance.revision += 1
+
     @property
     def short_file_threshold(self) -> float:
         """Get the short file threshold from theme, or use default"""
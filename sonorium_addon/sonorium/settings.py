@@ -204,8 +204,17 @@ class Settings(BaseSettings):
 
     path_audio: str = str(paths.audio)
 
+    # Serve the interactive API docs (/docs, /redoc, /openapi.json) from the web app
+    api_docs: bool = False
+
     def run(self):
-        asyncio.run(self.run_async())
+        # uvloop is optional (not available on Windows); fall back to the stdlib loop
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(self.run_async())
+        else:
+            uvloop.run(self.run_async())
 
     async def run_async(self):
         from sonorium.obs import logger
@@ -64,6 +64,11 @@ class ThemeDefinition:
             # Fallback to all recordings for backwards compatibility
             theme_metas = self.sonorium.metas
 
+        # Number of enabled instances and a change counter for their enabled flags,
+        # both maintained by RecordingThemeInstance.is_enabled
+        self.enabled_count = 0
+        self.revision = 0
+
         # Pass theme reference to instances so they can access threshold
         self.instances = IndexList(meta.get_instance(theme=self) for meta in theme_metas)
 
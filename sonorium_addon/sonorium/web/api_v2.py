@@ -3,21 +3,79 @@ Sonorium REST API
 
 Provides endpoints for the web UI to manage sessions, speaker groups,
 theme cycling, and retrieve speaker hierarchy from Home Assistant.
+
+All routes default to ORJSONResponse, so JSON bodies are encoded with orjson.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Optional
-from dataclasses import asdict
-
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks, Request, UploadFile, File
-from pydantic import BaseModel, Field
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import uuid
+import weakref
+import zipfile
+from itertools import islice
+from pathlib import Path
+from typing import Annotated, Optional
+from dataclasses import dataclass, fields
+from operator import attrgetter
+
+import httpx
+import orjson
+from fmtr.tools.string_tools import sanitize
+from fastapi import APIRouter, HTTPException, status, BackgroundTasks, Request, UploadFile, File, Response, Header
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, StringConstraints, TypeAdapter, ValidationError
 
 from sonorium.core.state import SpeakerSelection, CycleConfig, NameSource
 from sonorium.obs import logger
 
 
+# Timeout for the debug endpoint's raw HA states fetch (seconds)
+DEBUG_STATES_TIMEOUT = 10.0
+
+# Number of raw media_player states included in /debug/speakers
+DEBUG_STATES_SAMPLE_SIZE = 20
+
+# Audio file types accepted for theme track uploads
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.flac', '.ogg'})
+
+# Uploaded audio is copied to disk in chunks of this size (bytes)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Entity ID prefix of Home Assistant speakers
+MEDIA_PLAYER_PREFIX = "media_player."
+
+# Theme name -> folder name: drop punctuation, then join words with underscores
+_FOLDER_NAME_STRIP = re.compile(r'[^\w\s-]')
+_FOLDER_NAME_SEPARATORS = re.compile(r'[-\s]+')
+
+# Per-process ETag prefix, so revision counters that restart at zero never
+# match a validator a client cached from a previous run
+_ETAG_EPOCH = format(time.time_ns(), "x")
+
+
+# --- Constrained Types ---
+
+# Material Design icon name, e.g. "mdi:speaker-group"
+MdiIcon = Annotated[str, StringConstraints(max_length=64, pattern=r"^mdi:[a-z0-9-]+$")]
+
+# Numeric ranges shared by several request models
+Volume = Annotated[int, Field(ge=0, le=100)]
+IntervalMinutes = Annotated[int, Field(ge=1, le=1440)]  # 1 min to 24 hours
+CrossfadeSeconds = Annotated[float, Field(ge=0, le=10.0)]
+MaxGroups = Annotated[int, Field(ge=1, le=50)]
+
+# Prefix used for MQTT topics and HA entity IDs, e.g. "sonorium"
+EntityPrefix = Annotated[str, StringConstraints(min_length=1, max_length=32, pattern=r"^[a-z0-9_]+$")]
+
+
 # --- Request/Response Models ---
 
 class SpeakerSelectionModel(BaseModel):
@@ -41,7 +99,7 @@ class SpeakerSelectionModel(BaseModel):
 class CycleConfigModel(BaseModel):
     """Theme cycling configuration."""
     enabled: bool = False
-    interval_minutes: int = Field(default=60, ge=1, le=1440)  # 1 min to 24 hours
+    interval_minutes: IntervalMinutes = 60
     randomize: bool = False
     theme_ids: list[str] = Field(default_factory=list)  # Empty = all themes
     
@@ -80,7 +138,7 @@ class CreateSessionRequest(BaseModel):
     speaker_group_id: Optional[str] = None
     adhoc_selection: Optional[SpeakerSelectionModel] = None
     custom_name: Optional[str] = None
-    volume: Optional[int] = Field(default=None, ge=0, le=100)
+    volume: Optional[Volume] = None
     cycle_config: Optional[CycleConfigModel] = None
 
 
@@ -91,14 +149,14 @@ class UpdateSessionRequest(BaseModel):
     speaker_group_id: Optional[str] = None
     adhoc_selection: Optional[SpeakerSelectionModel] = None
     custom_name: Optional[str] = None
-    volume: Optional[int] = Field(default=None, ge=0, le=100)
+    volume: Optional[Volume] = None
     cycle_config: Optional[CycleConfigModel] = None
 
 
 class UpdateCycleRequest(BaseModel):
     """Request to update cycling configuration."""
     enabled: Optional[bool] = None
-    interval_minutes: Optional[int] = Field(default=None, ge=1, le=1440)
+    interval_minutes: Optional[IntervalMinutes] = None
     randomize: Optional[bool] = None
     theme_ids: Optional[list[str]] = None
 
@@ -125,7 +183,7 @@ class SessionResponse(BaseModel):
 class CreateGroupRequest(BaseModel):
     """Request to create a new speaker group."""
     name: str
-    icon: str = "mdi:speaker-group"
+    icon: MdiIcon = "mdi:speaker-group"
     include_floors: list[str] = Field(default_factory=list)
     include_areas: list[str] = Field(default_factory=list)
     include_speakers: list[str] = Field(default_factory=list)
@@ -136,7 +194,7 @@ class CreateGroupRequest(BaseModel):
 class UpdateGroupRequest(BaseModel):
     """Request to update an existing speaker group."""
     name: Optional[str] = None
-    icon: Optional[str] = None
+    icon: Optional[MdiIcon] = None
     include_floors: Optional[list[str]] = None
     include_areas: Optional[list[str]] = None
     include_speakers: Optional[list[str]] = None
@@ -163,11 +221,12 @@ class GroupResponse(BaseModel):
 
 class VolumeRequest(BaseModel):
     """Request to set volume."""
-    volume: int = Field(ge=0, le=100)
+    volume: Volume
 
 
-class SettingsResponse(BaseModel):
-    """Settings response."""
+@dataclass(slots=True)
+class SettingsResponse:
+    """Settings response (plain dataclass; only used for the response schema)."""
     default_volume: int
     crossfade_duration: float
     max_groups: int
@@ -177,18 +236,19 @@ class SettingsResponse(BaseModel):
     master_gain: int
     default_cycle_interval: int
     default_cycle_randomize: bool
+    version: int
 
 
 class UpdateSettingsRequest(BaseModel):
     """Request to update settings."""
-    default_volume: Optional[int] = Field(default=None, ge=0, le=100)
-    crossfade_duration: Optional[float] = Field(default=None, ge=0, le=10.0)
-    max_groups: Optional[int] = Field(default=None, ge=1, le=50)
-    entity_prefix: Optional[str] = None
+    default_volume: Optional[Volume] = None
+    crossfade_duration: Optional[CrossfadeSeconds] = None
+    max_groups: Optional[MaxGroups] = None
+    entity_prefix: Optional[EntityPrefix] = None
     show_in_sidebar: Optional[bool] = None
     auto_create_quick_play: Optional[bool] = None
-    master_gain: Optional[int] = Field(default=None, ge=0, le=100)
-    default_cycle_interval: Optional[int] = Field(default=None, ge=1, le=1440)
+    master_gain: Optional[Volume] = None
+    default_cycle_interval: Optional[IntervalMinutes] = None
     default_cycle_randomize: Optional[bool] = None
 
 
@@ -196,6 +256,7 @@ class SpeakerSettingsResponse(BaseModel):
     """Speaker settings response with hierarchy."""
     enabled_speakers: list[str]  # Empty = all enabled
     hierarchy: Optional[dict] = None  # Full speaker hierarchy
+    version: int = 0  # Settings version, see SonoriumSettings.version
 
 
 class UpdateSpeakerSettingsRequest(BaseModel):
@@ -225,6 +286,25 @@ class UpdateCustomAreaRequest(BaseModel):
     speakers: Optional[list[str]] = None
 
 
+class CreateThemeRequest(BaseModel):
+    """Request to create a new theme folder."""
+    name: str = ""
+    description: str = ""
+    icon: str = "🎵"
+
+
+class UpdateThemeMetadataRequest(BaseModel):
+    """Request to update theme metadata; only fields present in the body are applied."""
+    description: Optional[str] = None
+    icon: Optional[str] = None  # Empty/null clears the icon (use auto-detection)
+    short_file_threshold: Optional[float] = Field(default=None, ge=0)
+
+
+# Validators for hand-parsed theme bodies, built once and reused per request
+_CREATE_THEME_ADAPTER = TypeAdapter(CreateThemeRequest)
+_UPDATE_THEME_METADATA_ADAPTER = TypeAdapter(UpdateThemeMetadataRequest)
+
+
 # --- Plugin Models ---
 
 class PluginResponse(BaseModel):
@@ -264,33 +344,279 @@ class ChannelResponse(BaseModel):
 
 # --- Helper Functions ---
 
+# Shared read-only defaults for sessions without a cycle config
+_DEFAULT_CYCLE_CONFIG = CycleConfig()
+_DEFAULT_CYCLE_RESPONSE = CycleConfigResponse.model_construct(
+    enabled=False,
+    interval_minutes=60,
+    randomize=False,
+    theme_ids=[],
+)
+
+
+# CycleConfigResponse instances keyed by config contents; configs are edited in
+# place, so identity can't be used as the key. Cleared if it grows past the cap.
+_cycle_response_cache: dict[tuple, CycleConfigResponse] = {}
+_CYCLE_RESPONSE_CACHE_MAX = 256
+
+
+def _cycle_config_to_response(cycle_config: Optional[CycleConfig]) -> CycleConfigResponse:
+    """Convert a CycleConfig to a shared, read-only CycleConfigResponse."""
+    if cycle_config is None:
+        return _DEFAULT_CYCLE_RESPONSE
+    key = (
+        cycle_config.enabled,
+        cycle_config.interval_minutes,
+        cycle_config.randomize,
+        tuple(cycle_config.theme_ids),
+    )
+    response = _cycle_response_cache.get(key)
+    if response is None:
+        if len(_cycle_response_cache) >= _CYCLE_RESPONSE_CACHE_MAX:
+            _cycle_response_cache.clear()
+        response = CycleConfigResponse.model_construct(
+            enabled=key[0],
+            interval_minutes=key[1],
+            randomize=key[2],
+            theme_ids=list(key[3]),
+        )
+        _cycle_response_cache[key] = response
+    return response
+
+
+def _cycle_status_response(session, cycle_manager) -> dict:
+    """
+    Build the cycling status for a session as a CycleStatusResponse-shaped dict.
+
+    Runtime status is only queried from the cycle manager when cycling is
+    enabled and the session is playing; otherwise the stored config is
+    returned as-is.
+    """
+    cycle_config = session.cycle_config or _DEFAULT_CYCLE_CONFIG
+
+    if cycle_config.enabled and session.is_playing and cycle_manager:
+        status_data = cycle_manager.get_cycle_status(session.id) or {}
+    else:
+        status_data = {}
+
+    return {
+        "enabled": cycle_config.enabled,
+        "interval_minutes": cycle_config.interval_minutes,
+        "randomize": cycle_config.randomize,
+        "theme_ids": cycle_config.theme_ids,
+        "next_change": status_data.get("next_change"),
+        "seconds_until_change": status_data.get("seconds_until_change"),
+        "themes_in_rotation": status_data.get("themes_in_rotation", 0),
+    }
+
+
+# Encoded body for list endpoints whose backing manager is unavailable
+_EMPTY_LIST_JSON = b"[]"
+
+
+def _json_response(content: bytes, status_code: int = 200) -> Response:
+    """Wrap already-encoded JSON bytes in a Response."""
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+
+def _discard(items: list, item) -> bool:
+    """Remove item from a list in a single scan; returns whether it was present."""
+    try:
+        items.remove(item)
+    except ValueError:
+        return False
+    return True
+
+
+def _model_response(model: BaseModel, status_code: int = 200) -> ORJSONResponse:
+    """
+    Return an internally built response model without FastAPI re-validating it.
+
+    Endpoints using this declare the model as response_model for the OpenAPI
+    schema only; returning a Response skips the response-model pass.
+    """
+    return ORJSONResponse(model.model_dump(), status_code=status_code)
+
+
+def _etag(*revisions) -> str:
+    """Build a strong ETag from revision counters."""
+    return '"' + "-".join(map(str, (_ETAG_EPOCH, *revisions))) + '"'
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already holds the current ETag."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
+def _with_etag(response: Response, etag: str) -> Response:
+    """Attach the ETag, asking clients to revalidate before reusing the body."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+# SonoriumSettings fields exposed through SettingsResponse
+_SETTINGS_FIELDS = tuple(f.name for f in fields(SettingsResponse))
+_settings_getter = attrgetter(*_SETTINGS_FIELDS)
+
+
+def _settings_to_dict(settings) -> dict:
+    """
+    Convert SonoriumSettings to a SettingsResponse-shaped dict.
+
+    Settings values were validated on the way in, so the dict is returned
+    directly as encoded JSON without a response-model pass.
+    """
+    return dict(zip(_SETTINGS_FIELDS, _settings_getter(settings)))
+
+
+# to_dict() results keyed by id() of the SpeakerSelection they were built from.
+# Selections are replaced rather than edited, so identity is a safe key; the
+# weakref guards against id reuse and drops the entry when the selection dies.
+_adhoc_dict_cache: dict[int, tuple[weakref.ref, dict]] = {}
+
+
+def _adhoc_dict(selection: SpeakerSelection) -> dict:
+    """Return selection.to_dict(), reusing the result for the same selection object."""
+    key = id(selection)
+    entry = _adhoc_dict_cache.get(key)
+    if entry is not None and entry[0]() is selection:
+        return entry[1]
+    data = selection.to_dict()
+    ref = weakref.ref(selection, lambda _, key=key: _adhoc_dict_cache.pop(key, None))
+    _adhoc_dict_cache[key] = (ref, data)
+    return data
+
+
 def _session_to_response(session, session_manager) -> SessionResponse:
-    """Convert a Session to SessionResponse."""
-    cycle_config = session.cycle_config or CycleConfig()
-    return SessionResponse(
+    """Convert a Session to SessionResponse (trusted internal data, not re-validated)."""
+    return SessionResponse.model_construct(
         id=session.id,
         name=session.name,
         name_source=session.name_source.value,
         theme_id=session.theme_id,
         preset_id=getattr(session, 'preset_id', None),
         speaker_group_id=session.speaker_group_id,
-        adhoc_selection=asdict(session.adhoc_selection) if session.adhoc_selection else None,
+        adhoc_selection=_adhoc_dict(session.adhoc_selection) if session.adhoc_selection else None,
         volume=session.volume,
         is_playing=session.is_playing,
         speakers=session_manager.get_resolved_speakers(session),
         speaker_summary=session_manager.get_speaker_summary(session),
         channel_id=session_manager.get_session_channel(session.id),
-        cycle_config=CycleConfigResponse(
-            enabled=cycle_config.enabled,
-            interval_minutes=cycle_config.interval_minutes,
-            randomize=cycle_config.randomize,
-            theme_ids=cycle_config.theme_ids,
-        ),
+        cycle_config=_cycle_config_to_response(session.cycle_config),
         created_at=session.created_at,
         last_played_at=session.last_played_at,
     )
 
 
+def _group_to_response(group, resolve_bundle: tuple[list[str], int, str]) -> GroupResponse:
+    """
+    Convert a SpeakerGroup to GroupResponse.
+
+    Args:
+        group: SpeakerGroup instance
+        resolve_bundle: (speakers, speaker_count, summary) from GroupManager.resolve_full
+    """
+    speakers, speaker_count, summary = resolve_bundle
+    return GroupResponse.model_construct(
+        id=group.id,
+        name=group.name,
+        icon=group.icon,
+        include_floors=group.include_floors,
+        include_areas=group.include_areas,
+        include_speakers=group.include_speakers,
+        exclude_areas=group.exclude_areas,
+        exclude_speakers=group.exclude_speakers,
+        speakers=speakers,
+        speaker_count=speaker_count,
+        summary=summary,
+        created_at=group.created_at,
+        updated_at=group.updated_at,
+    )
+
+
+# Media roots searched for theme folders, in priority order
+_THEME_MEDIA_PATHS = (
+    Path("/media/sonorium"),
+    Path("/share/sonorium"),
+)
+
+# _find_theme_folder() hits as theme_id -> (media root mtimes, folder). Creating,
+# renaming or removing a theme folder bumps its root's mtime, invalidating the entry.
+_theme_folder_cache: dict[str, tuple[tuple, Path]] = {}
+
+# First existing entry of _THEME_MEDIA_PATHS, kept until it disappears
+_media_root_path: Path | None = None
+
+
+def _media_root() -> Path | None:
+    """Media root new themes are written to, or None if neither root exists."""
+    global _media_root_path
+    if _media_root_path is not None and _media_root_path.exists():
+        return _media_root_path
+    _media_root_path = next((mp for mp in _THEME_MEDIA_PATHS if mp.exists()), None)
+    return _media_root_path
+
+
+def _media_roots_mtime() -> tuple:
+    """Modification times of the media roots (None for a missing root)."""
+    mtimes = []
+    for mp in _THEME_MEDIA_PATHS:
+        try:
+            mtimes.append(mp.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _find_theme_folder(theme_id: str):
+    """Find theme folder by ID, reusing a previous lookup while the media roots are unchanged."""
+    mtimes = _media_roots_mtime()
+    cached = _theme_folder_cache.get(theme_id)
+    if cached is not None and cached[0] == mtimes:
+        return cached[1]
+
+    folder = _scan_theme_folder(theme_id)
+    if folder is not None:
+        # Misses aren't cached: a new folder's metadata.json may not be written yet
+        _theme_folder_cache[theme_id] = (mtimes, folder)
+    return folder
+
+
+def _scan_theme_folder(theme_id: str):
+    """Find theme folder by ID, handling sanitized names and UUID-based IDs."""
+    for mp in _THEME_MEDIA_PATHS:
+        if not mp.exists():
+            continue
+
+        # Try exact match first (folder name = theme_id)
+        exact_path = mp / theme_id
+        if exact_path.exists():
+            return exact_path
+
+        # Scan folders for UUID match in metadata.json or sanitized name match
+        for folder in mp.iterdir():
+            if folder.is_dir():
+                # Check metadata.json for UUID match
+                metadata_path = folder / "metadata.json"
+                if metadata_path.exists():
+                    try:
+                        metadata = orjson.loads(metadata_path.read_bytes())
+                        if metadata.get("id") == theme_id:
+                            return folder
+                    except Exception:
+                        pass
+
+                # Try sanitized folder name match
+                sanitized = sanitize(folder.name)
+                if sanitized == theme_id:
+                    return folder
+
+    return None
+
+
 # --- API Router Factory ---
 
 def create_api_router(
@@ -303,6 +629,7 @@ def create_api_router(
     cycle_manager=None,
     plugin_manager=None,
     mqtt_manager=None,
+    on_themes_changed=None,
 ) -> APIRouter:
     """
     Create the API router with all endpoints.
@@ -317,20 +644,23 @@ def create_api_router(
         cycle_manager: Optional CycleManager for theme cycling
         plugin_manager: Optional PluginManager for plugin endpoints
         mqtt_manager: Optional MQTT manager for HA entity updates
+        on_themes_changed: Optional callback invoked after theme folders or metadata change
 
     Returns:
         Configured APIRouter
     """
-    router = APIRouter(prefix="/api", tags=["api"])
+    router = APIRouter(prefix="/api", tags=["api"], default_response_class=ORJSONResponse)
+
+    def _themes_changed():
+        """Notify the owner that cached theme listings are stale."""
+        if on_themes_changed:
+            on_themes_changed()
     
     # --- Debug Endpoint ---
     
     @router.get("/debug/speakers")
     async def debug_speakers() -> dict:
         """Debug endpoint to show raw speaker discovery data."""
-        from fmtr.tools import http
-        from sonorium.settings import settings
-        
         debug_info = {
             "api_url": ha_registry.api_url,
             "token_present": bool(ha_registry.token),
@@ -346,22 +676,27 @@ def create_api_router(
         # Try to get raw states
         try:
             url = f"{ha_registry.api_url}/states"
-            with http.Client() as client:
-                response = client.get(url, headers=ha_registry.headers)
-                states = response.json()
-                
-                # Filter to media_player entities
-                media_players = [
-                    {
-                        "entity_id": s.get("entity_id"),
-                        "state": s.get("state"),
-                        "friendly_name": s.get("attributes", {}).get("friendly_name"),
-                    }
-                    for s in states
-                    if s.get("entity_id", "").startswith("media_player.")
-                ]
-                debug_info["raw_states_sample"] = media_players[:20]  # Limit to 20
-                debug_info["total_media_players_in_states"] = len(media_players)
+            async with httpx.AsyncClient(timeout=DEBUG_STATES_TIMEOUT) as client:
+                response = await client.get(url, headers=ha_registry.headers)
+            states = orjson.loads(response.content)
+
+            # Filter lazily: the sample is taken from the front of the stream and
+            # the remaining media players are only counted, never collected
+            media_players = (
+                s for s in states
+                if s.get("entity_id", "").startswith(MEDIA_PLAYER_PREFIX)
+            )
+            debug_info["raw_states_sample"] = [
+                {
+                    "entity_id": s.get("entity_id"),
+                    "state": s.get("state"),
+                    "friendly_name": s.get("attributes", {}).get("friendly_name"),
+                }
+                for s in islice(media_players, DEBUG_STATES_SAMPLE_SIZE)
+            ]
+            debug_info["total_media_players_in_states"] = (
+                len(debug_info["raw_states_sample"]) + sum(1 for _ in media_players)
+            )
         except Exception as e:
             debug_info["errors"].append(f"Failed to fetch states: {str(e)}")
         
@@ -408,14 +743,21 @@ def create_api_router(
     
     # --- Session Endpoints ---
     
-    @router.get("/sessions")
-    async def list_sessions() -> list[SessionResponse]:
+    @router.get("/sessions", response_model=list[SessionResponse])
+    async def list_sessions(request: Request):
         """List all sessions."""
+        etag = _etag(session_manager.revision, group_manager.revision, ha_registry.version)
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
         sessions = session_manager.list()
-        return [_session_to_response(s, session_manager) for s in sessions]
+        return _with_etag(
+            ORJSONResponse([_session_to_response(s, session_manager).model_dump() for s in sessions]),
+            etag,
+        )
     
-    @router.post("/sessions", status_code=status.HTTP_201_CREATED)
-    async def create_session(request: CreateSessionRequest) -> SessionResponse:
+    @router.post("/sessions", status_code=status.HTTP_201_CREATED, response_model=SessionResponse)
+    async def create_session(request: CreateSessionRequest):
         """Create a new session."""
         try:
             session = session_manager.create(
@@ -427,20 +769,20 @@ def create_api_router(
                 volume=request.volume,
                 cycle_config=request.cycle_config.to_config() if request.cycle_config else None,
             )
-            return _session_to_response(session, session_manager)
+            return _model_response(_session_to_response(session, session_manager), status.HTTP_201_CREATED)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-    @router.get("/sessions/{session_id}")
-    async def get_session(session_id: str) -> SessionResponse:
+    @router.get("/sessions/{session_id}", response_model=SessionResponse)
+    async def get_session(session_id: str):
         """Get a session by ID."""
         session = session_manager.get(session_id)
         if not session:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-        return _session_to_response(session, session_manager)
+        return _model_response(_session_to_response(session, session_manager))
     
-    @router.put("/sessions/{session_id}")
-    async def update_session(session_id: str, request: UpdateSessionRequest) -> SessionResponse:
+    @router.put("/sessions/{session_id}", response_model=SessionResponse)
+    async def update_session(session_id: str, request: UpdateSessionRequest):
         """Update an existing session."""
         # Get old session name to detect changes for MQTT discovery refresh
         old_session = session_manager.get(session_id)
@@ -470,7 +812,7 @@ def create_api_router(
             except Exception as e:
                 logger.warning(f"Failed to refresh MQTT discovery for renamed session: {e}")
 
-        return _session_to_response(session, session_manager)
+        return _model_response(_session_to_response(session, session_manager))
     
     @router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
     async def delete_session(session_id: str):
@@ -492,10 +834,12 @@ def create_api_router(
         if not speakers:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No speakers selected")
         
-        # Mark as playing immediately (optimistic update)
+        # Mark as playing immediately (optimistic update); persisted by a
+        # debounced save so rapid play actions coalesce into one write
         session.is_playing = True
         session.mark_played()
-        state_store.save()
+        session_manager.revision += 1
+        state_store.schedule_save()
         
         # Fire the play command in the background - don't wait for it
         asyncio.create_task(session_manager.play(session_id))
@@ -538,32 +882,17 @@ def create_api_router(
     
     # --- Theme Cycling Endpoints ---
     
-    @router.get("/sessions/{session_id}/cycle")
-    async def get_cycle_status(session_id: str) -> CycleStatusResponse:
+    @router.get("/sessions/{session_id}/cycle", response_model=CycleStatusResponse)
+    async def get_cycle_status(session_id: str):
         """Get cycling status for a session."""
         session = session_manager.get(session_id)
         if not session:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
         
-        cycle_config = session.cycle_config or CycleConfig()
-        
-        # Get runtime status from cycle manager
-        status_data = None
-        if cycle_manager and session.is_playing:
-            status_data = cycle_manager.get_cycle_status(session_id)
-        
-        return CycleStatusResponse(
-            enabled=cycle_config.enabled,
-            interval_minutes=cycle_config.interval_minutes,
-            randomize=cycle_config.randomize,
-            theme_ids=cycle_config.theme_ids,
-            next_change=status_data.get("next_change") if status_data else None,
-            seconds_until_change=status_data.get("seconds_until_change") if status_data else None,
-            themes_in_rotation=status_data.get("themes_in_rotation", 0) if status_data else 0,
-        )
+        return ORJSONResponse(_cycle_status_response(session, cycle_manager))
     
-    @router.put("/sessions/{session_id}/cycle")
-    async def update_cycle_config(session_id: str, request: UpdateCycleRequest) -> CycleStatusResponse:
+    @router.put("/sessions/{session_id}/cycle", response_model=CycleStatusResponse)
+    async def update_cycle_config(session_id: str, request: UpdateCycleRequest):
         """Update cycling configuration for a session."""
         session = session_manager.update_cycle_config(
             session_id=session_id,
@@ -575,22 +904,7 @@ def create_api_router(
         if not session:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
         
-        cycle_config = session.cycle_config
-        
-        # Get runtime status from cycle manager
-        status_data = None
-        if cycle_manager and session.is_playing:
-            status_data = cycle_manager.get_cycle_status(session_id)
-        
-        return CycleStatusResponse(
-            enabled=cycle_config.enabled,
-            interval_minutes=cycle_config.interval_minutes,
-            randomize=cycle_config.randomize,
-            theme_ids=cycle_config.theme_ids,
-            next_change=status_data.get("next_change") if status_data else None,
-            seconds_until_change=status_data.get("seconds_until_change") if status_data else None,
-            themes_in_rotation=status_data.get("themes_in_rotation", 0) if status_data else 0,
-        )
+        return ORJSONResponse(_cycle_status_response(session, cycle_manager))
     
     @router.post("/sessions/{session_id}/cycle/skip")
     async def skip_to_next_theme(session_id: str) -> dict:
@@ -615,25 +929,31 @@ def create_api_router(
     
     # --- Channel Endpoints ---
     
-    @router.get("/channels")
-    async def list_channels() -> list[ChannelResponse]:
+    # Encoded channel list as (channel manager revision, JSON bytes)
+    channels_cache = None
+
+    @router.get("/channels", response_model=list[ChannelResponse])
+    async def list_channels():
         """List all channels."""
+        nonlocal channels_cache
         if not channel_manager:
-            return []
-        return [
-            ChannelResponse(**ch)
-            for ch in channel_manager.list_channels()
-        ]
-
-    @router.get("/channels/{channel_id}")
-    async def get_channel(channel_id: int) -> ChannelResponse:
+            return _json_response(_EMPTY_LIST_JSON)
+        revision = channel_manager.revision
+        if channels_cache is None or channels_cache[0] != revision:
+            # Channel.to_dict() already has the ChannelResponse shape
+            channels_cache = (revision, orjson.dumps(channel_manager.list_channels()))
+        return _json_response(channels_cache[1])
+
+    @router.get("/channels/{channel_id}", response_model=ChannelResponse)
+    async def get_channel(channel_id: int):
         """Get a specific channel."""
         if not channel_manager:
             raise HTTPException(status_code=503, detail="Channel system not initialized")
         channel = channel_manager.get_channel(channel_id)
         if not channel:
             raise HTTPException(status_code=404, detail=f"Channel {channel_id} not found")
-        return ChannelResponse(**channel.to_dict())
+        # Channel.to_dict() already has the ChannelResponse shape
+        return ORJSONResponse(channel.to_dict())
 
     @router.post("/channels/{channel_id}/play")
     async def play_channel(channel_id: int, request: dict = None):
@@ -707,31 +1027,24 @@ def create_api_router(
 
     # --- Speaker Group Endpoints ---
     
-    @router.get("/groups")
-    async def list_groups() -> list[GroupResponse]:
+    @router.get("/groups", response_model=list[GroupResponse])
+    async def list_groups(request: Request):
         """List all speaker groups."""
+        etag = _etag(group_manager.revision, ha_registry.version)
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
         groups = group_manager.list()
-        return [
-            GroupResponse(
-                id=g.id,
-                name=g.name,
-                icon=g.icon,
-                include_floors=g.include_floors,
-                include_areas=g.include_areas,
-                include_speakers=g.include_speakers,
-                exclude_areas=g.exclude_areas,
-                exclude_speakers=g.exclude_speakers,
-                speakers=group_manager.resolve(g),
-                speaker_count=group_manager.get_speaker_count(g),
-                summary=group_manager.get_summary(g),
-                created_at=g.created_at,
-                updated_at=g.updated_at,
-            )
-            for g in groups
-        ]
+        return _with_etag(
+            ORJSONResponse([
+                _group_to_response(g, bundle).model_dump()
+                for g, bundle in zip(groups, group_manager.bulk_resolve(groups))
+            ]),
+            etag,
+        )
     
-    @router.post("/groups", status_code=status.HTTP_201_CREATED)
-    async def create_group(request: CreateGroupRequest) -> GroupResponse:
+    @router.post("/groups", status_code=status.HTTP_201_CREATED, response_model=GroupResponse)
+    async def create_group(request: CreateGroupRequest):
         """Create a new speaker group."""
         try:
             group = group_manager.create(
@@ -743,48 +1056,20 @@ def create_api_router(
                 exclude_areas=request.exclude_areas,
                 exclude_speakers=request.exclude_speakers,
             )
-            return GroupResponse(
-                id=group.id,
-                name=group.name,
-                icon=group.icon,
-                include_floors=group.include_floors,
-                include_areas=group.include_areas,
-                include_speakers=group.include_speakers,
-                exclude_areas=group.exclude_areas,
-                exclude_speakers=group.exclude_speakers,
-                speakers=group_manager.resolve(group),
-                speaker_count=group_manager.get_speaker_count(group),
-                summary=group_manager.get_summary(group),
-                created_at=group.created_at,
-                updated_at=group.updated_at,
-            )
+            return _model_response(_group_to_response(group, group_manager.resolve_full(group)), status.HTTP_201_CREATED)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-    @router.get("/groups/{group_id}")
-    async def get_group(group_id: str) -> GroupResponse:
+    @router.get("/groups/{group_id}", response_model=GroupResponse)
+    async def get_group(group_id: str):
         """Get a speaker group by ID."""
         group = group_manager.get(group_id)
         if not group:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
-        return GroupResponse(
-            id=group.id,
-            name=group.name,
-            icon=group.icon,
-            include_floors=group.include_floors,
-            include_areas=group.include_areas,
-            include_speakers=group.include_speakers,
-            exclude_areas=group.exclude_areas,
-            exclude_speakers=group.exclude_speakers,
-            speakers=group_manager.resolve(group),
-            speaker_count=group_manager.get_speaker_count(group),
-            summary=group_manager.get_summary(group),
-            created_at=group.created_at,
-            updated_at=group.updated_at,
-        )
+        return _model_response(_group_to_response(group, group_manager.resolve_full(group)))
     
-    @router.put("/groups/{group_id}")
-    async def update_group(group_id: str, request: UpdateGroupRequest) -> GroupResponse:
+    @router.put("/groups/{group_id}", response_model=GroupResponse)
+    async def update_group(group_id: str, request: UpdateGroupRequest):
         """Update an existing speaker group."""
         try:
             group = group_manager.update(
@@ -799,21 +1084,7 @@ def create_api_router(
             )
             if not group:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
-            return GroupResponse(
-                id=group.id,
-                name=group.name,
-                icon=group.icon,
-                include_floors=group.include_floors,
-                include_areas=group.include_areas,
-                include_speakers=group.include_speakers,
-                exclude_areas=group.exclude_areas,
-                exclude_speakers=group.exclude_speakers,
-                speakers=group_manager.resolve(group),
-                speaker_count=group_manager.get_speaker_count(group),
-                summary=group_manager.get_summary(group),
-                created_at=group.created_at,
-                updated_at=group.updated_at,
-            )
+            return _model_response(_group_to_response(group, group_manager.resolve_full(group)))
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
@@ -836,27 +1107,29 @@ def create_api_router(
         group = group_manager.get(group_id)
         if not group:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
-        speakers = group_manager.resolve(group)
+        speakers, count, summary = group_manager.resolve_full(group)
         return {
             "speakers": speakers,
-            "count": len(speakers),
-            "summary": group_manager.get_summary(group),
+            "count": count,
+            "summary": summary,
         }
     
     # --- Speaker Hierarchy Endpoints ---
     
-    @router.get("/speakers")
-    async def list_speakers() -> list[dict]:
+    @router.get("/speakers", response_model=None, response_class=ORJSONResponse)
+    async def list_speakers():
         """List all available speakers (flat list)."""
-        hierarchy = ha_registry.hierarchy
-        speakers = hierarchy.get_all_speakers()
-        return [s.to_dict() for s in speakers]
-    
-    @router.get("/speakers/hierarchy")
-    async def get_speaker_hierarchy() -> dict:
+        return _json_response(ha_registry.speakers_json)
+
+    @router.get("/speakers/hierarchy", response_model=dict)
+    async def get_speaker_hierarchy(request: Request):
         """Get full floor/area/speaker hierarchy."""
-        hierarchy = ha_registry.hierarchy
-        return hierarchy.to_dict()
+        content = ha_registry.hierarchy_json  # May refresh (and bump the version) on first use
+        etag = _etag(ha_registry.version)
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        return _with_etag(_json_response(content), etag)
     
     @router.post("/speakers/refresh")
     async def refresh_speakers() -> dict:
@@ -885,340 +1158,363 @@ def create_api_router(
         }
     
     # --- Settings Endpoints ---
-    
-    @router.get("/settings")
-    async def get_settings() -> SettingsResponse:
-        """Get current settings."""
-        settings = state_store.settings
-        return SettingsResponse(
-            default_volume=settings.default_volume,
-            crossfade_duration=settings.crossfade_duration,
-            max_groups=settings.max_groups,
-            entity_prefix=settings.entity_prefix,
-            show_in_sidebar=settings.show_in_sidebar,
-            auto_create_quick_play=settings.auto_create_quick_play,
-            master_gain=settings.master_gain,
-            default_cycle_interval=settings.default_cycle_interval,
-            default_cycle_randomize=settings.default_cycle_randomize,
-        )
 
-    @router.put("/settings")
-    async def update_settings(request: UpdateSettingsRequest) -> SettingsResponse:
-        """Update settings."""
-        settings = state_store.settings
+    # Held across each settings read-modify-write, so a handler never observes
+    # another request's half-applied change. Saves are debounced through
+    # StateStore.schedule_save(), so bursts of edits share one write.
+    settings_lock = asyncio.Lock()
+
+    # Encoded settings response as (settings object, version, JSON bytes)
+    settings_cache = None
+
+    def _settings_changed():
+        """Record a settings mutation and schedule it to be saved."""
+        state_store.settings.version += 1
+        state_store.schedule_save()
+
+    def _matches_version(tag: str) -> bool:
+        """Whether one If-Match entry names the current settings version."""
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            return False  # If-Match uses strong comparison
+        parts = tag.strip('"').split("-")
+        version = str(state_store.settings.version)
+        if len(parts) == 1:
+            return parts[0] == version  # Bare version number
+        # An ETag from a settings GET: epoch, settings version, then any other revisions
+        return parts[0] == _ETAG_EPOCH and parts[1] == version
+
+    def _check_version(if_match: Optional[str]):
+        """Reject a write whose If-Match (ETag, bare version or "*") is not the current settings version."""
+        if if_match is not None and not any(_matches_version(tag) for tag in if_match.split(",")):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Settings changed (current version {state_store.settings.version})",
+            )
 
-        if request.default_volume is not None:
-            settings.default_volume = request.default_volume
-        if request.crossfade_duration is not None:
-            settings.crossfade_duration = request.crossfade_duration
-        if request.max_groups is not None:
-            settings.max_groups = request.max_groups
-        if request.entity_prefix is not None:
-            settings.entity_prefix = request.entity_prefix
-        if request.show_in_sidebar is not None:
-            settings.show_in_sidebar = request.show_in_sidebar
-        if request.auto_create_quick_play is not None:
-            settings.auto_create_quick_play = request.auto_create_quick_play
-        if request.master_gain is not None:
-            settings.master_gain = request.master_gain
-        if request.default_cycle_interval is not None:
-            settings.default_cycle_interval = request.default_cycle_interval
-        if request.default_cycle_randomize is not None:
-            settings.default_cycle_randomize = request.default_cycle_randomize
-
-        state_store.save()
-
-        return SettingsResponse(
-            default_volume=settings.default_volume,
-            crossfade_duration=settings.crossfade_duration,
-            max_groups=settings.max_groups,
-            entity_prefix=settings.entity_prefix,
-            show_in_sidebar=settings.show_in_sidebar,
-            auto_create_quick_play=settings.auto_create_quick_play,
-            master_gain=settings.master_gain,
-            default_cycle_interval=settings.default_cycle_interval,
-            default_cycle_randomize=settings.default_cycle_randomize,
-        )
+    def _settings_content() -> bytes:
+        """Return the encoded settings response, rebuilding it if stale."""
+        nonlocal settings_cache
+        settings = state_store.settings
+        if settings_cache is None or settings_cache[0] is not settings or settings_cache[1] != settings.version:
+            settings_cache = (settings, settings.version, orjson.dumps(_settings_to_dict(settings)))
+        return settings_cache[2]
+    
+    @router.get("/settings", response_model=SettingsResponse, response_class=ORJSONResponse)
+    async def get_settings(request: Request):
+        """Get current settings."""
+        etag = _etag(state_store.settings.version)
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        return _with_etag(_json_response(_settings_content()), etag)
+
+    @router.put("/settings", response_model=SettingsResponse, response_class=ORJSONResponse)
+    async def update_settings(request: UpdateSettingsRequest,
+                              if_match: Annotated[Optional[str], Header()] = None):
+        """Update settings (If-Match, when sent, must carry the current settings version)."""
+        async with settings_lock:
+            _check_version(if_match)
+            settings = state_store.settings
+
+            # Apply only the fields the client actually sent (explicit nulls are ignored)
+            # and that differ from the current values; a no-op PUT touches nothing
+            patch = request.model_dump(exclude_unset=True, exclude_none=True)
+            changes = {field: value for field, value in patch.items() if getattr(settings, field) != value}
+            if changes:
+                for field, value in changes.items():
+                    setattr(settings, field, value)
+                settings.version += 1
+                changes["version"] = settings.version
+                await state_store.append_settings(changes)
+
+            return _with_etag(_json_response(_settings_content()), _etag(settings.version))
 
     # --- Speaker Settings Endpoints ---
 
-    @router.get("/settings/speakers")
-    async def get_speaker_settings() -> SpeakerSettingsResponse:
-        """Get enabled speakers and full hierarchy."""
-        settings = state_store.settings
-        hierarchy = None
-        if ha_registry:
-            hierarchy = ha_registry.get_hierarchy_dict()
-        return SpeakerSettingsResponse(
-            enabled_speakers=settings.enabled_speakers,
-            hierarchy=hierarchy,
-        )
+    def _speaker_settings_response(settings) -> ORJSONResponse:
+        """Build a SpeakerSettingsResponse body, embedding the registry's pre-encoded hierarchy."""
+        return ORJSONResponse({
+            "enabled_speakers": settings.enabled_speakers,
+            "hierarchy": orjson.Fragment(ha_registry.hierarchy_json) if ha_registry else None,
+            "version": settings.version,
+        })
 
-    @router.put("/settings/speakers")
-    async def update_speaker_settings(request: UpdateSpeakerSettingsRequest) -> SpeakerSettingsResponse:
-        """Update enabled speakers list."""
-        settings = state_store.settings
-        settings.enabled_speakers = request.enabled_speakers
-        state_store.save()
-
-        hierarchy = None
-        if ha_registry:
-            hierarchy = ha_registry.get_hierarchy_dict()
-        return SpeakerSettingsResponse(
-            enabled_speakers=settings.enabled_speakers,
-            hierarchy=hierarchy,
-        )
+    def _speaker_settings_etag() -> str:
+        return _etag(state_store.settings.version, ha_registry.version if ha_registry else None)
 
-    @router.post("/settings/speakers/enable")
-    async def enable_speaker(request: SingleSpeakerRequest) -> SpeakerSettingsResponse:
+    @router.get("/settings/speakers", response_model=SpeakerSettingsResponse)
+    async def get_speaker_settings(request: Request):
+        """Get enabled speakers and full hierarchy."""
+        etag = _speaker_settings_etag()
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        return _with_etag(_speaker_settings_response(state_store.settings), etag)
+
+    @router.put("/settings/speakers", response_model=SpeakerSettingsResponse)
+    async def update_speaker_settings(request: UpdateSpeakerSettingsRequest,
+                                      if_match: Annotated[Optional[str], Header()] = None):
+        """Update enabled speakers list (If-Match, when sent, must carry the current settings version)."""
+        async with settings_lock:
+            _check_version(if_match)
+            settings = state_store.settings
+            settings.enabled_speakers = request.enabled_speakers
+            _settings_changed()
+
+            return _with_etag(_speaker_settings_response(settings), _speaker_settings_etag())
+
+    @router.post("/settings/speakers/enable", response_model=SpeakerSettingsResponse)
+    async def enable_speaker(request: SingleSpeakerRequest):
         """Enable a single speaker."""
-        settings = state_store.settings
-        entity_id = request.entity_id
-
-        # If enabled_speakers is empty, all are enabled - nothing to do
-        if not settings.enabled_speakers:
-            # Need to switch to explicit mode: add all speakers except this one... wait no
-            # Actually if empty = all enabled, then enabling one speaker doesn't change anything
-            pass
-        else:
-            # Add to enabled list if not already there
-            if entity_id not in settings.enabled_speakers:
-                settings.enabled_speakers.append(entity_id)
-                state_store.save()
-
-        hierarchy = None
-        if ha_registry:
-            hierarchy = ha_registry.get_hierarchy_dict()
-        return SpeakerSettingsResponse(
-            enabled_speakers=settings.enabled_speakers,
-            hierarchy=hierarchy,
-        )
+        async with settings_lock:
+            settings = state_store.settings
+            entity_id = request.entity_id
+
+            # If enabled_speakers is empty, all are enabled - nothing to do
+            if not settings.enabled_speakers:
+                # Need to switch to explicit mode: add all speakers except this one... wait no
+                # Actually if empty = all enabled, then enabling one speaker doesn't change anything
+                pass
+            else:
+                # Add to enabled list if not already there
+                if entity_id not in settings.enabled_speakers:
+                    settings.enabled_speakers.append(entity_id)
+                    _settings_changed()
 
-    @router.post("/settings/speakers/disable")
-    async def disable_speaker(request: SingleSpeakerRequest) -> SpeakerSettingsResponse:
+            return _speaker_settings_response(settings)
+
+    @router.post("/settings/speakers/disable", response_model=SpeakerSettingsResponse)
+    async def disable_speaker(request: SingleSpeakerRequest):
         """Disable a single speaker."""
-        settings = state_store.settings
-        entity_id = request.entity_id
-
-        # If enabled_speakers is empty, all are enabled - need to switch to explicit mode
-        if not settings.enabled_speakers:
-            # Get all speakers and add all except the one being disabled
-            if ha_registry:
-                all_speakers = ha_registry.get_all_speaker_ids()
-                settings.enabled_speakers = [s for s in all_speakers if s != entity_id]
+        async with settings_lock:
+            settings = state_store.settings
+            entity_id = request.entity_id
+
+            # If enabled_speakers is empty, all are enabled - need to switch to explicit mode
+            if not settings.enabled_speakers:
+                # Get all speakers and add all except the one being disabled
+                if ha_registry:
+                    # get_all_speaker_ids() builds a fresh list, so drop the entry in place
+                    all_speakers = ha_registry.get_all_speaker_ids()
+                    _discard(all_speakers, entity_id)
+                    settings.enabled_speakers = all_speakers
+                else:
+                    # Can't disable without knowing all speakers
+                    raise HTTPException(status_code=400, detail="Cannot disable speaker: speaker list not available")
             else:
-                # Can't disable without knowing all speakers
-                raise HTTPException(status_code=400, detail="Cannot disable speaker: speaker list not available")
-        else:
-            # Remove from enabled list
-            if entity_id in settings.enabled_speakers:
-                settings.enabled_speakers.remove(entity_id)
-
-        state_store.save()
-
-        hierarchy = None
-        if ha_registry:
-            hierarchy = ha_registry.get_hierarchy_dict()
-        return SpeakerSettingsResponse(
-            enabled_speakers=settings.enabled_speakers,
-            hierarchy=hierarchy,
-        )
+                # Remove from enabled list
+                _discard(settings.enabled_speakers, entity_id)
+
+            _settings_changed()
+
+            return _speaker_settings_response(settings)
 
-    @router.post("/settings/speakers/enable-all")
-    async def enable_all_speakers() -> SpeakerSettingsResponse:
+    @router.post("/settings/speakers/enable-all", response_model=SpeakerSettingsResponse)
+    async def enable_all_speakers():
         """Enable all speakers (clear the enabled list)."""
-        settings = state_store.settings
-        settings.enabled_speakers = []  # Empty = all enabled
-        state_store.save()
-
-        hierarchy = None
-        if ha_registry:
-            hierarchy = ha_registry.get_hierarchy_dict()
-        return SpeakerSettingsResponse(
-            enabled_speakers=settings.enabled_speakers,
-            hierarchy=hierarchy,
-        )
+        async with settings_lock:
+            settings = state_store.settings
+            settings.enabled_speakers = []  # Empty = all enabled
+            _settings_changed()
+
+            return _speaker_settings_response(settings)
 
     # --- Custom Speaker Areas (fallback when HA areas unavailable) ---
+    # Responses are encoded while the lock is held (ORJSONResponse renders on
+    # construction), so they never alias lists another handler is mutating.
 
     @router.get("/settings/speaker-areas")
-    async def get_custom_speaker_areas() -> dict:
+    async def get_custom_speaker_areas(request: Request):
         """Get custom speaker area assignments."""
+        etag = _etag(state_store.settings.version)
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
         settings = state_store.settings
-        return {
+        return _with_etag(ORJSONResponse({
             "custom_areas": settings.custom_speaker_areas,
-        }
+        }), etag)
 
     @router.put("/settings/speaker-areas")
-    async def update_custom_speaker_areas(request: CustomAreasRequest) -> dict:
-        """Update all custom speaker area assignments."""
-        settings = state_store.settings
-        settings.custom_speaker_areas = request.custom_areas
-        state_store.save()
-        return {
-            "custom_areas": settings.custom_speaker_areas,
-        }
+    async def update_custom_speaker_areas(request: CustomAreasRequest,
+                                          if_match: Annotated[Optional[str], Header()] = None):
+        """Update all custom speaker area assignments (If-Match, when sent, must carry the current settings version)."""
+        async with settings_lock:
+            _check_version(if_match)
+            settings = state_store.settings
+            settings.custom_speaker_areas = request.custom_areas
+            _settings_changed()
+            return _with_etag(ORJSONResponse({
+                "custom_areas": settings.custom_speaker_areas,
+            }), _etag(settings.version))
 
     @router.post("/settings/speaker-areas/create")
-    async def create_custom_area(request: CreateCustomAreaRequest) -> dict:
+    async def create_custom_area(request: CreateCustomAreaRequest):
         """Create a new custom speaker area."""
-        settings = state_store.settings
-        area_name = request.name.strip()
-        if not area_name:
-            raise HTTPException(status_code=400, detail="Area name is required")
-        if area_name in settings.custom_speaker_areas:
-            raise HTTPException(status_code=400, detail="Area already exists")
-
-        settings.custom_speaker_areas[area_name] = request.speakers
-        state_store.save()
-        return {
-            "name": area_name,
-            "speakers": settings.custom_speaker_areas[area_name],
-        }
+        async with settings_lock:
+            settings = state_store.settings
+            area_name = request.name.strip()
+            if not area_name:
+                raise HTTPException(status_code=400, detail="Area name is required")
+            if area_name in settings.custom_speaker_areas:
+                raise HTTPException(status_code=400, detail="Area already exists")
+
+            settings.custom_speaker_areas[area_name] = request.speakers
+            _settings_changed()
+            return ORJSONResponse({
+                "name": area_name,
+                "speakers": settings.custom_speaker_areas[area_name],
+            })
 
     @router.put("/settings/speaker-areas/{area_name}")
-    async def update_custom_area(area_name: str, request: UpdateCustomAreaRequest) -> dict:
+    async def update_custom_area(area_name: str, request: UpdateCustomAreaRequest):
         """Update a custom speaker area."""
-        settings = state_store.settings
-        if area_name not in settings.custom_speaker_areas:
-            raise HTTPException(status_code=404, detail="Area not found")
-
-        # Handle rename
-        new_name = (request.name or area_name).strip()
-        speakers = request.speakers if request.speakers is not None else settings.custom_speaker_areas[area_name]
+        async with settings_lock:
+            settings = state_store.settings
+            if area_name not in settings.custom_speaker_areas:
+                raise HTTPException(status_code=404, detail="Area not found")
+
+            # Handle rename
+            new_name = (request.name or area_name).strip()
+            speakers = request.speakers if request.speakers is not None else settings.custom_speaker_areas[area_name]
+
+            if new_name != area_name:
+                if new_name in settings.custom_speaker_areas:
+                    raise HTTPException(status_code=400, detail="Area already exists")
+                # Rename in place, keeping the area's position in the (UI-ordered) dict
+                settings.custom_speaker_areas = {
+                    (new_name if name == area_name else name): (speakers if name == area_name else members)
+                    for name, members in settings.custom_speaker_areas.items()
+                }
+            else:
+                settings.custom_speaker_areas[area_name] = speakers
 
-        if new_name != area_name:
-            # Rename: delete old, create new
-            del settings.custom_speaker_areas[area_name]
-            settings.custom_speaker_areas[new_name] = speakers
-        else:
-            settings.custom_speaker_areas[area_name] = speakers
-
-        state_store.save()
-        return {
-            "name": new_name,
-            "speakers": speakers,
-        }
+            _settings_changed()
+            return ORJSONResponse({
+                "name": new_name,
+                "speakers": speakers,
+            })
 
     @router.delete("/settings/speaker-areas/{area_name}")
     async def delete_custom_area(area_name: str) -> dict:
         """Delete a custom speaker area."""
-        settings = state_store.settings
-        if area_name not in settings.custom_speaker_areas:
-            raise HTTPException(status_code=404, detail="Area not found")
+        async with settings_lock:
+            settings = state_store.settings
+            if area_name not in settings.custom_speaker_areas:
+                raise HTTPException(status_code=404, detail="Area not found")
 
-        del settings.custom_speaker_areas[area_name]
-        state_store.save()
-        return {"deleted": area_name}
+            del settings.custom_speaker_areas[area_name]
+            _settings_changed()
+            return {"deleted": area_name}
 
     @router.post("/settings/speaker-areas/{area_name}/add-speaker")
-    async def add_speaker_to_area(area_name: str, request: SingleSpeakerRequest) -> dict:
+    async def add_speaker_to_area(area_name: str, request: SingleSpeakerRequest):
         """Add a speaker to a custom area."""
-        settings = state_store.settings
-        if area_name not in settings.custom_speaker_areas:
-            raise HTTPException(status_code=404, detail="Area not found")
+        async with settings_lock:
+            settings = state_store.settings
+            if area_name not in settings.custom_speaker_areas:
+                raise HTTPException(status_code=404, detail="Area not found")
 
-        if request.entity_id not in settings.custom_speaker_areas[area_name]:
-            settings.custom_speaker_areas[area_name].append(request.entity_id)
-            state_store.save()
+            if request.entity_id not in settings.custom_speaker_areas[area_name]:
+                settings.custom_speaker_areas[area_name].append(request.entity_id)
+                _settings_changed()
 
-        return {
-            "name": area_name,
-            "speakers": settings.custom_speaker_areas[area_name],
-        }
+            return ORJSONResponse({
+                "name": area_name,
+                "speakers": settings.custom_speaker_areas[area_name],
+            })
 
     @router.post("/settings/speaker-areas/{area_name}/remove-speaker")
-    async def remove_speaker_from_area(area_name: str, request: SingleSpeakerRequest) -> dict:
+    async def remove_speaker_from_area(area_name: str, request: SingleSpeakerRequest):
         """Remove a speaker from a custom area."""
-        settings = state_store.settings
-        if area_name not in settings.custom_speaker_areas:
-            raise HTTPException(status_code=404, detail="Area not found")
+        async with settings_lock:
+            settings = state_store.settings
+            if area_name not in settings.custom_speaker_areas:
+                raise HTTPException(status_code=404, detail="Area not found")
 
-        if request.entity_id in settings.custom_speaker_areas[area_name]:
-            settings.custom_speaker_areas[area_name].remove(request.entity_id)
-            state_store.save()
+            if _discard(settings.custom_speaker_areas[area_name], request.entity_id):
+                _settings_changed()
 
-        return {
-            "name": area_name,
-            "speakers": settings.custom_speaker_areas[area_name],
-        }
+            return ORJSONResponse({
+                "name": area_name,
+                "speakers": settings.custom_speaker_areas[area_name],
+            })
 
     # --- Theme Endpoints ---
     # NOTE: GET /themes is handled by app.py with full metadata support
     # api_v2.py only handles theme management (create, upload, delete, metadata)
 
-    @router.post("/themes/create")
+    @router.post("/themes/create", openapi_extra={
+        "requestBody": {"content": {"application/json": {"schema": CreateThemeRequest.model_json_schema()}}},
+    })
     async def create_theme(request: Request):
         """Create a new theme folder."""
-        from pathlib import Path
-        import re
-        import json
+        _theme_folder_cache.clear()
 
         try:
-            body = await request.json()
-        except Exception:
+            body = _CREATE_THEME_ADAPTER.validate_json(await request.body())
+        except ValidationError:
             raise HTTPException(status_code=400, detail="Invalid JSON body")
 
-        name = body.get("name", "").strip()
-        description = body.get("description", "").strip()
-        icon = body.get("icon", "🎵").strip()
+        name = body.name.strip()
+        description = body.description.strip()
+        icon = body.icon.strip()
 
         if not name:
             raise HTTPException(status_code=400, detail="Theme name is required")
 
         # Generate a safe folder name from the theme name
-        folder_name = re.sub(r'[^\w\s-]', '', name.lower())
-        folder_name = re.sub(r'[-\s]+', '_', folder_name).strip('_')
+        folder_name = _FOLDER_NAME_STRIP.sub('', name.lower())
+        folder_name = _FOLDER_NAME_SEPARATORS.sub('_', folder_name).strip('_')
 
         if not folder_name:
             raise HTTPException(status_code=400, detail="Invalid theme name - could not generate folder name")
 
-        # Find the media path
-        media_paths = [
-            Path("/media/sonorium"),
-            Path("/share/sonorium"),
-        ]
-
-        media_path = None
-        for mp in media_paths:
-            if mp.exists():
-                media_path = mp
-                break
-
-        if not media_path:
-            # Try to create the default media path
-            media_path = Path("/media/sonorium")
-            try:
-                media_path.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                logger.error(f"Failed to create media path: {e}")
-                raise HTTPException(status_code=500, detail="Media path not available")
-
-        # Create the theme folder
-        theme_path = media_path / folder_name
-        if theme_path.exists():
-            raise HTTPException(status_code=409, detail=f"Theme folder '{folder_name}' already exists")
+        # metadata.json contents (description and non-default icon)
+        metadata = {}
+        if description:
+            metadata["description"] = description
+        if icon and icon != "🎵":  # Only store non-default icons
+            metadata["icon"] = icon
+
+        def create_on_disk() -> Path:
+            media_path = _media_root()
+            if not media_path:
+                # Try to create the default media path
+                media_path = _THEME_MEDIA_PATHS[0]
+                try:
+                    media_path.mkdir(parents=True, exist_ok=True)
+                except Exception as e:
+                    logger.error(f"Failed to create media path: {e}")
+                    raise HTTPException(status_code=500, detail="Media path not available")
+
+            # Create the theme folder
+            theme_path = media_path / folder_name
+            if theme_path.exists():
+                raise HTTPException(status_code=409, detail=f"Theme folder '{folder_name}' already exists")
 
-        try:
             theme_path.mkdir(parents=True, exist_ok=True)
             logger.info(f"Created theme folder: {theme_path}")
-
-            # Write metadata.json with description and icon
-            metadata = {}
-            if description:
-                metadata["description"] = description
-            if icon and icon != "🎵":  # Only store non-default icons
-                metadata["icon"] = icon
             if metadata:
                 metadata_path = theme_path / "metadata.json"
-                metadata_path.write_text(json.dumps(metadata, indent=2))
+                metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            return theme_path
 
+        try:
+            # Filesystem work runs in a worker thread (media roots may be network mounts)
+            theme_path = await asyncio.to_thread(create_on_disk)
+            _themes_changed()
             return {
                 "status": "ok",
                 "theme_id": folder_name,
                 "path": str(theme_path),
                 "message": f"Theme '{name}' created successfully"
             }
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Failed to create theme folder: {e}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -1226,7 +1522,7 @@ def create_api_router(
     @router.post("/themes/{theme_id}/upload")
     async def upload_theme_file(theme_id: str, request: Request):
         """Upload an audio file to a theme folder."""
-        theme_path = _find_theme_folder(theme_id)
+        theme_path = await asyncio.to_thread(_find_theme_folder, theme_id)
         if not theme_path:
             raise HTTPException(status_code=404, detail=f"Theme '{theme_id}' not found")
 
@@ -1237,27 +1533,39 @@ def create_api_router(
             if not file:
                 raise HTTPException(status_code=400, detail="No file provided")
 
-            # Validate file extension
-            valid_extensions = ['.mp3', '.wav', '.flac', '.ogg']
-            filename = file.filename
-            ext = '.' + filename.split('.')[-1].lower() if '.' in filename else ''
+            # Validate file extension (and drop any client-supplied directory part)
+            filename = os.path.basename(file.filename)
+            ext = os.path.splitext(filename)[1].lower()
 
-            if ext not in valid_extensions:
-                raise HTTPException(status_code=400, detail=f"Invalid file type. Supported: {', '.join(valid_extensions)}")
+            if ext not in AUDIO_EXTENSIONS:
+                raise HTTPException(status_code=400, detail=f"Invalid file type. Supported: {', '.join(sorted(AUDIO_EXTENSIONS))}")
 
             # Save the file
             file_path = theme_path / filename
 
-            # Read and write the file content
-            content = await file.read()
-            file_path.write_bytes(content)
-
-            logger.info(f"Uploaded file to theme '{theme_id}': {filename} ({len(content)} bytes)")
+            # Copy the upload to disk chunk by chunk, so only one chunk is held in memory
+            size = 0
+            out = await asyncio.to_thread(file_path.open, "wb")
+            try:
+                while True:
+                    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    await asyncio.to_thread(out.write, chunk)
+                    size += len(chunk)
+            except BaseException:
+                await asyncio.to_thread(out.close)
+                file_path.unlink(missing_ok=True)  # Don't leave a truncated track behind
+                raise
+            await asyncio.to_thread(out.close)
+            _themes_changed()
+
+            logger.info(f"Uploaded file to theme '{theme_id}': {filename} ({size} bytes)")
 
             return {
                 "status": "ok",
                 "filename": filename,
-                "size": len(content),
+                "size": size,
                 "theme_id": theme_id
             }
 
@@ -1267,85 +1575,49 @@ def create_api_router(
             logger.error(f"Failed to upload file: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    def _find_theme_folder(theme_id: str):
-        """Find theme folder by ID, handling sanitized names and UUID-based IDs."""
-        import json
-        from pathlib import Path
-        from fmtr.tools.string_tools import sanitize
-
-        media_paths = [
-            Path("/media/sonorium"),
-            Path("/share/sonorium"),
-        ]
-
-        for mp in media_paths:
-            if not mp.exists():
-                continue
-
-            # Try exact match first (folder name = theme_id)
-            exact_path = mp / theme_id
-            if exact_path.exists():
-                return exact_path
-
-            # Scan folders for UUID match in metadata.json or sanitized name match
-            for folder in mp.iterdir():
-                if folder.is_dir():
-                    # Check metadata.json for UUID match
-                    metadata_path = folder / "metadata.json"
-                    if metadata_path.exists():
-                        try:
-                            metadata = json.loads(metadata_path.read_text())
-                            if metadata.get("id") == theme_id:
-                                return folder
-                        except Exception:
-                            pass
-
-                    # Try sanitized folder name match
-                    sanitized = sanitize(folder.name)
-                    if sanitized == theme_id:
-                        return folder
-
-        return None
-
-    @router.put("/themes/{theme_id}/metadata")
+    @router.put("/themes/{theme_id}/metadata", openapi_extra={
+        "requestBody": {"content": {"application/json": {"schema": UpdateThemeMetadataRequest.model_json_schema()}}},
+    })
     async def update_theme_metadata(theme_id: str, request: Request):
         """Update theme metadata (description, etc.)."""
-        import json
-
-        theme_path = _find_theme_folder(theme_id)
+        theme_path = await asyncio.to_thread(_find_theme_folder, theme_id)
         if not theme_path:
             raise HTTPException(status_code=404, detail=f"Theme '{theme_id}' not found")
 
-        # Parse JSON body
+        # Parse and validate JSON body
         try:
-            body = await request.json()
-        except Exception:
-            raise HTTPException(status_code=400, detail="Invalid JSON body")
+            body = _UPDATE_THEME_METADATA_ADAPTER.validate_json(await request.body())
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e.errors()[0]['msg']}")
+        provided = body.model_fields_set
 
         # Read existing metadata and merge
         metadata_path = theme_path / "metadata.json"
-        metadata = {}
-        if metadata_path.exists():
-            try:
-                metadata = json.loads(metadata_path.read_text())
-            except Exception:
-                pass
 
-        if "description" in body:
-            metadata["description"] = body["description"]
+        def read_metadata() -> dict:
+            if metadata_path.exists():
+                try:
+                    return orjson.loads(metadata_path.read_bytes())
+                except Exception:
+                    pass
+            return {}
+
+        metadata = await asyncio.to_thread(read_metadata)
+        original = dict(metadata)
+
+        if "description" in provided:
+            metadata["description"] = body.description
 
-        if "icon" in body:
+        if "icon" in provided:
             # Allow setting icon to empty string to clear it (use auto-detection)
-            icon_value = body["icon"]
+            icon_value = body.icon
             if icon_value:
                 metadata["icon"] = icon_value
             elif "icon" in metadata:
                 del metadata["icon"]  # Remove icon to use auto-detection
 
-        if "short_file_threshold" in body:
-            threshold = float(body["short_file_threshold"])
-            if threshold < 0:
-                raise HTTPException(status_code=400, detail="short_file_threshold must be >= 0")
+        if "short_file_threshold" in provided and body.short_file_threshold is not None:
+            threshold = body.short_file_threshold
             metadata["short_file_threshold"] = threshold
 
             # Also update the live theme object if it exists
@@ -1355,9 +1627,12 @@ def create_api_router(
                     theme.short_file_threshold = threshold
                     logger.info(f"Updated short_file_threshold for '{theme_id}' to {threshold}s")
 
-        # Write back
+        # Write back (skipped when the merge changed nothing, e.g. a save-on-blur resend)
+        if metadata == original:
+            return {"status": "ok", "metadata": metadata}
         try:
-            metadata_path.write_text(json.dumps(metadata, indent=2))
+            await asyncio.to_thread(metadata_path.write_bytes, orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            _themes_changed()
             return {"status": "ok", "metadata": metadata}
         except Exception as e:
             logger.error(f"Failed to write metadata: {e}")
@@ -1366,14 +1641,19 @@ def create_api_router(
     @router.delete("/themes/{theme_id}")
     async def delete_theme(theme_id: str):
         """Delete a theme folder and all its contents."""
-        import shutil
+        _theme_folder_cache.clear()
 
-        theme_path = _find_theme_folder(theme_id)
+        theme_path = await asyncio.to_thread(_find_theme_folder, theme_id)
         if not theme_path:
             raise HTTPException(status_code=404, detail=f"Theme '{theme_id}' not found")
 
         try:
-            shutil.rmtree(theme_path)
+            try:
+                await asyncio.to_thread(shutil.rmtree, theme_path)
+            finally:
+                # Even a failed rmtree may have removed part of the folder
+                _theme_folder_cache.clear()
+                _themes_changed()
             logger.info(f"Deleted theme folder: {theme_path}")
 
             # Remove from favorites if present
@@ -1381,7 +1661,7 @@ def create_api_router(
                 favorites = state_store.settings.favorite_themes
                 if theme_id in favorites:
                     favorites.remove(theme_id)
-                    state_store.save()
+                    state_store.schedule_save()
 
             return {"status": "ok", "theme_id": theme_id, "message": "Theme deleted"}
         except Exception as e:
@@ -1391,11 +1671,7 @@ def create_api_router(
     @router.get("/themes/{theme_id}/export")
     async def export_theme(theme_id: str):
         """Export a theme as a zip file containing all audio files and metadata."""
-        import zipfile
-        import io
-        from fastapi.responses import StreamingResponse
-
-        theme_path = _find_theme_folder(theme_id)
+        theme_path = await asyncio.to_thread(_find_theme_folder, theme_id)
         if not theme_path:
             raise HTTPException(status_code=404, detail=f"Theme '{theme_id}' not found")
 
@@ -1436,16 +1712,11 @@ def create_api_router(
     @router.post("/themes/import")
     async def import_theme(request: Request):
         """Import a theme from a zip file."""
-        import zipfile
-        import io
-        import json
-        from pathlib import Path
+        _theme_folder_cache.clear()
 
         # Get the audio path
-        audio_path = Path("/media/sonorium")
-        if not audio_path.exists():
-            audio_path = Path("/share/sonorium")
-        if not audio_path.exists():
+        audio_path = await asyncio.to_thread(_media_root)
+        if not audio_path:
             raise HTTPException(status_code=500, detail="No valid audio path found")
 
         try:
@@ -1492,7 +1763,6 @@ def create_api_router(
                 # Extract files
                 target_path.mkdir(parents=True, exist_ok=True)
                 files_extracted = 0
-                audio_extensions = {'.mp3', '.wav', '.flac', '.ogg'}
 
                 for zip_info in zip_file.infolist():
                     if zip_info.is_dir():
@@ -1525,21 +1795,19 @@ def create_api_router(
                 metadata_path = target_path / "metadata.json"
                 if metadata_path.exists():
                     try:
-                        metadata = json.loads(metadata_path.read_text())
+                        metadata = orjson.loads(metadata_path.read_bytes())
                         # Generate new UUID to avoid conflicts
-                        import uuid
                         metadata["id"] = str(uuid.uuid4())
-                        metadata_path.write_text(json.dumps(metadata, indent=2))
+                        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
                     except Exception as e:
                         logger.warning(f"Could not update metadata UUID: {e}")
                 else:
                     # Create basic metadata
-                    import uuid
                     metadata = {
                         "id": str(uuid.uuid4()),
                         "name": theme_folder_name
                     }
-                    metadata_path.write_text(json.dumps(metadata, indent=2))
+                    metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
                 logger.info(f"Imported theme '{theme_folder_name}' with {files_extracted} files")
 
@@ -1557,6 +1825,10 @@ def create_api_router(
         except Exception as e:
             logger.error(f"Failed to import theme: {e}")
             raise HTTPException(status_code=500, detail=str(e))
+        finally:
+            # After extraction (or a partial one that failed midway)
+            _theme_folder_cache.clear()
+            _themes_changed()
 
     # --- Plugin Endpoints ---
 
@@ -1564,8 +1836,8 @@ def create_api_router(
     async def list_plugins():
         """List all available plugins."""
         if not plugin_manager:
-            return []
-        return plugin_manager.list_plugins()
+            return _json_response(_EMPTY_LIST_JSON)
+        return ORJSONResponse(plugin_manager.list_plugins())
 
     @router.get("/plugins/{plugin_id}", response_model=PluginResponse)
     async def get_plugin(plugin_id: str):
@@ -1577,7 +1849,7 @@ def create_api_router(
         if not plugin:
             raise HTTPException(status_code=404, detail=f"Plugin not found: {plugin_id}")
 
-        return plugin.to_dict()
+        return ORJSONResponse(plugin.to_dict())
 
     @router.put("/plugins/{plugin_id}/enable")
     async def enable_plugin(plugin_id: str):
@@ -1661,11 +1933,6 @@ def create_api_router(
 
         Returns the installed plugin info.
         """
-        import zipfile
-        import tempfile
-        import shutil
-        from pathlib import Path
-
         if not plugin_manager:
             raise HTTPException(status_code=503, detail="Plugin system not available")
 
@@ -1705,7 +1972,6 @@ def create_api_router(
                 manifest_file = plugin_source_dir / 'manifest.json'
                 manifest = {}
                 if manifest_file.exists():
-                    import json
                     manifest = json.loads(manifest_file.read_text())
                     plugin_id = manifest.get('id', plugin_source_dir.name)
                 else:
@@ -1731,7 +1997,6 @@ def create_api_router(
                 plugin_py_content = plugin_file.read_text()
 
                 # Check for version attribute (required)
-                import re
                 version_match = re.search(r'^\s*version\s*[=:]\s*["\']([^"\']+)["\']', plugin_py_content, re.MULTILINE)
                 manifest_version = manifest.get('version')
 
@@ -1802,8 +2067,6 @@ def create_api_router(
         3. Delete the plugin directory
         4. Remove plugin settings from state
         """
-        import shutil
-
         if not plugin_manager:
             raise HTTPException(status_code=503, detail="Plugin system not available")
 
@@ -1832,7 +2095,7 @@ def create_api_router(
                 del plugin_manager.state_store.settings.plugin_settings[plugin_id]
             if plugin_id in plugin_manager.state_store.settings.enabled_plugins:
                 plugin_manager.state_store.settings.enabled_plugins.remove(plugin_id)
-            plugin_manager.state_store.save()
+            await plugin_manager.state_store.save_async()
 
             return {
                 "status": "ok",
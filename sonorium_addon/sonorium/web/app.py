@@ -11,28 +11,73 @@ Creates and configures the FastAPI application with:
 
 from __future__ import annotations
 
-import logging
+import asyncio
+import gzip
+import hashlib
+import html
+import logging.config
+import os
+import re
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from fastapi import FastAPI, Request
-from fastapi.responses import StreamingResponse, HTMLResponse, FileResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse, HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from sonorium.version import __version__
 from sonorium.obs import logger
+from sonorium.recording import RecordingThemeInstance
+from sonorium.web.middleware import accepts_gzip, add_compression
 
 if TYPE_CHECKING:
     from fmtr.tools import mqtt
 
 
-# Suppress uvicorn access logs
-for name in ["uvicorn.access", "uvicorn.error", "uvicorn"]:
-    _logger = logging.getLogger(name)
-    _logger.handlers.clear()
-    _logger.propagate = False
+# Silence uvicorn's own loggers (applied by create_app and passed to uvicorn.run,
+# so uvicorn never installs its access-log handler in the first place)
+LOGGING_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "loggers": {
+        name: {"handlers": [], "propagate": False}
+        for name in ("uvicorn", "uvicorn.error", "uvicorn.access")
+    },
+}
 
 
+# Theme ID sanitization (matches ThemeDefinition): spaces and underscores become
+# dashes, keep word characters and dashes, then collapse dash runs
+_THEME_ID_SEPARATORS = str.maketrans({' ': '-', '_': '-'})
+_THEME_ID_STRIP = re.compile(r'[^\w-]')
+_THEME_ID_DASHES = re.compile(r'-{2,}')
+
+
+def _sanitize_theme_id(folder_name: str) -> str:
+    """Derive a theme ID from a folder name the same way ThemeDefinition does."""
+    sanitized = folder_name.lower().translate(_THEME_ID_SEPARATORS)
+    sanitized = _THEME_ID_STRIP.sub('', sanitized)
+    return _THEME_ID_DASHES.sub('-', sanitized).strip('-')
+
+
+# Theme media roots, in lookup order
+MEDIA_PATHS = (
+    Path("/media/sonorium"),
+    Path("/share/sonorium"),
+)
+
+# How often missing media roots are probed for again (they can be created at
+# runtime, e.g. by the v2 theme-creation endpoint, or mounted late)
+MEDIA_ROOT_REPROBE_SECONDS = 30.0
+
+# File extensions ThemeDefinition loads as recordings
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.flac', '.ogg'})
+
 # Template directory
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
@@ -48,12 +93,263 @@ STATIC_DIR = next((p for p in _static_candidates if p.exists()), _static_candida
 # In Docker container, files are at /app; in development, use relative path
 ADDON_DIR = Path("/app") if Path("/app/logo.png").exists() else Path(__file__).parent.parent.parent
 
+# Logo/icon are baked into the image, so clients may reuse them for a day
+ASSET_CACHE_CONTROL = "public, max-age=86400"
+
+
+def _find_asset(name: str) -> tuple[Path, os.stat_result] | None:
+    """Locate a bundled image (container path first, then the source tree) with its stat."""
+    for path in (Path("/app") / name, Path(__file__).parent.parent.parent / name):
+        try:
+            return path, path.stat()
+        except OSError:
+            continue
+    return None
+
+
 # Log paths at module load time
 logger.info(f"TEMPLATES_DIR: {TEMPLATES_DIR} (exists: {TEMPLATES_DIR.exists()})")
 logger.info(f"STATIC_DIR: {STATIC_DIR} (exists: {STATIC_DIR.exists()})")
 logger.info(f"ADDON_DIR: {ADDON_DIR} (exists: {ADDON_DIR.exists()})")
 
 
+# Live MP3 packets are ~400 bytes; streams hand them to Starlette in batches of at
+# least this many bytes (~0.5s of 128 kbps audio), so each worker-thread hop
+# carries a batch instead of a single packet
+STREAM_COALESCE_BYTES = 8 * 1024
+
+
+def _coalesce(chunks, size: int = STREAM_COALESCE_BYTES):
+    """Regroup an iterator of byte chunks into chunks of at least `size` bytes."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+# Coalesced chunks a stream reads ahead of its client (~2s of audio), so encoder
+# or pacing jitter doesn't stall the socket and a slow socket doesn't stall the encoder
+STREAM_READ_AHEAD = 4
+
+
+# Upper bound on concurrently open /stream connections. Each one holds a thread
+# of the stream executor while it paces and encodes audio.
+MAX_CONCURRENT_STREAMS = 16
+
+
+class _SlotStreamingResponse(StreamingResponse):
+    """StreamingResponse that frees a /stream slot once it has been sent, however that ends."""
+
+    def __init__(self, content, slots: asyncio.Semaphore, **kwargs):
+        super().__init__(content, **kwargs)
+        self._slots = slots
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._slots.release()
+
+
+# Fixed-shape rows of the theme payloads. orjson encodes slotted dataclasses
+# natively, reading the slots instead of building and walking a dict per row.
+
+@dataclass(slots=True)
+class ThemeListing:
+    """One entry of GET /api/themes."""
+    id: str
+    name: str
+    total_tracks: int
+    enabled_tracks: int
+    url: str
+    description: str
+    icon: str
+    is_favorite: bool
+    has_audio: bool
+
+
+@dataclass(slots=True)
+class ThemeStatus:
+    """One entry of the themes list in GET /api/status."""
+    name: str
+    id: str
+    total_tracks: int
+    enabled_tracks: int
+    url: str
+
+
+# POST /api/batch operations: op -> (result key, is_enabled value)
+_BATCH_OPS = {
+    "enable_all": ("enabled", True),
+    "disable_all": ("disabled", False),
+}
+
+
+# Legacy v1 UI page; only the version and the theme cards vary per render
+_LEGACY_PAGE = string.Template('''<!DOCTYPE html>
+<html>
+<head>
+    <title>Sonorium $version</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <meta http-equiv="refresh" content="10">
+    <style>
+        * { box-sizing: border-box; }
+        body { 
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+            color: #eee;
+            margin: 0;
+            padding: 20px;
+            min-height: 100vh;
+        }
+        .container { max-width: 800px; margin: 0 auto; }
+        h1 { 
+            color: #00d4ff;
+            text-align: center;
+            margin-bottom: 10px;
+        }
+        .subtitle {
+            text-align: center;
+            color: #888;
+            margin-bottom: 30px;
+        }
+        .version-switch {
+            text-align: center;
+            margin-bottom: 20px;
+        }
+        .version-switch a {
+            color: #00d4ff;
+            text-decoration: none;
+        }
+        .theme-card {
+            background: rgba(255,255,255,0.08);
+            border-radius: 12px;
+            padding: 20px;
+            margin-bottom: 20px;
+            border: 2px solid transparent;
+        }
+        .theme-card.current {
+            border-color: #00d4ff;
+        }
+        .theme-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 15px;
+        }
+        .theme-header h3 {
+            margin: 0;
+            color: #fff;
+        }
+        .track-count {
+            color: #00d4ff;
+            font-size: 14px;
+        }
+        .recordings {
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
+            gap: 8px;
+            margin-bottom: 15px;
+            max-height: 200px;
+            overflow-y: auto;
+        }
+        .rec {
+            padding: 6px 10px;
+            background: rgba(0,0,0,0.3);
+            border-radius: 6px;
+            font-size: 12px;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+        .rec.enabled { color: #00ff88; }
+        .rec.disabled { color: #666; }
+        .rec .status { margin-right: 5px; }
+        .theme-actions {
+            display: flex;
+            gap: 10px;
+        }
+        button {
+            padding: 10px 16px;
+            border: none;
+            border-radius: 8px;
+            font-size: 14px;
+            cursor: pointer;
+            background: #00d4ff;
+            color: #000;
+            font-weight: bold;
+        }
+        button:hover { opacity: 0.9; }
+        button.secondary {
+            background: rgba(255,255,255,0.2);
+            color: #fff;
+        }
+        button.play {
+            background: #00ff88;
+            flex: 1;
+        }
+        .stream-url {
+            margin-top: 10px;
+            font-size: 11px;
+            color: #666;
+            font-family: monospace;
+        }
+        .status-msg {
+            position: fixed;
+            bottom: 20px;
+            left: 50%;
+            transform: translateX(-50%);
+            background: #00d4ff;
+            color: #000;
+            padding: 10px 20px;
+            border-radius: 8px;
+            display: none;
+        }
+        .status-msg.show { display: block; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🎵 Sonorium $version</h1>
+        <p class="subtitle">Ambient Soundscape Mixer • Auto-refreshes every 10s</p>
+        <p class="version-switch"><a href="/">→ Try the new v2 UI with multi-zone support</a></p>
+        $theme_cards
+    </div>
+    <div class="status-msg" id="status"></div>
+    
+    <script>
+        function showStatus(msg) {
+            const el = document.getElementById('status');
+            el.textContent = msg;
+            el.classList.add('show');
+            setTimeout(() => el.classList.remove('show'), 2000);
+        }
+        
+        async function enableAll(themeId) {
+            await fetch('/api/enable_all/' + themeId, {method: 'POST'});
+            showStatus('All recordings enabled!');
+            setTimeout(() => location.reload(), 500);
+        }
+        
+        async function disableAll(themeId) {
+            await fetch('/api/disable_all/' + themeId, {method: 'POST'});
+            showStatus('All recordings disabled');
+            setTimeout(() => location.reload(), 500);
+        }
+        
+        function playTheme(themeId) {
+            window.open('/stream/' + themeId, '_blank');
+            showStatus('Opening audio stream...');
+        }
+    </script>
+</body>
+</html>''')
+
+
 class SonoriumApp:
     """
     Sonorium v2 FastAPI Application.
@@ -73,12 +369,21 @@ class SonoriumApp:
         Args:
             mqtt_client: MQTT client for legacy v1 functionality
         """
+        from sonorium.settings import settings
+
         self.mqtt_client = mqtt_client
+        # API docs are opt-in (SONORIUM__API_DOCS): without them FastAPI never
+        # builds the OpenAPI schema and the doc routes aren't registered
         self.app = FastAPI(
             title=f"Sonorium {__version__}",
             version=__version__,
-            docs_url="/docs",
+            docs_url="/docs" if settings.api_docs else None,
+            redoc_url="/redoc" if settings.api_docs else None,
+            openapi_url="/openapi.json" if settings.api_docs else None,
+            default_response_class=ORJSONResponse,
         )
+        add_compression(self.app)
+        self.app.add_event_handler("shutdown", self._shutdown)
         
         # Components (initialized lazily)
         self._state_store = None
@@ -88,6 +393,56 @@ class SonoriumApp:
         self._group_manager = None
         self._plugin_manager = None
         self._initialized = False
+
+        # Rendered legacy UI as (themes list, current theme, instance revision, HTML bytes, gzipped HTML, ETag)
+        self._legacy_html_cache = None
+
+        # Encoded /api/status body as ((themes, count, current theme, instance revision), JSON bytes)
+        self._status_cache = None
+
+        # HA core API and stream base URLs, resolved once by initialize_v2()
+        self._api_url = None
+        self._stream_base_url = None
+
+        # Audio streams block (encoding and real-time pacing sleeps), so they run on
+        # their own threads rather than Starlette's shared threadpool, where they
+        # would compete with every other sync handler and file response
+        self._stream_executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_STREAMS, thread_name_prefix="sonorium-stream",
+        )
+        self._stream_slots = asyncio.Semaphore(MAX_CONCURRENT_STREAMS)
+
+        # Existing entries of MEDIA_PATHS, and when they were last probed (monotonic)
+        self._media_roots: tuple[Path, ...] = ()
+        self._media_roots_probed = 0.0
+        self.refresh_media_roots()
+
+        # Media root -> (root st_mtime_ns, ({folder name: path}, {sanitized ID: path}))
+        self._folder_cache: dict[Path, tuple[int, tuple[dict, dict]]] = {}
+
+        # metadata.json path -> (st_mtime_ns, parsed dict); shared dicts, treat as read-only
+        self._meta_cache: dict[Path, tuple[int, dict]] = {}
+
+        # Theme folder -> (st_mtime_ns, whether it holds audio files)
+        self._audio_cache: dict[Path, tuple[int, bool]] = {}
+
+        # Theme lookup table as (themes list, its length, {theme_id: theme})
+        self._theme_index = None
+
+        # Encoded /api/themes/{id} bodies: theme_id -> (theme, theme revision, JSON bytes)
+        self._theme_json_cache: dict[str, tuple] = {}
+
+        # Logo and icon, resolved once as (path, stat) or None if missing
+        self._logo = _find_asset("logo.png")
+        self._icon = _find_asset("icon.png")
+        if self._logo:
+            logger.info(f"Serving logo from: {self._logo[0]}")
+        else:
+            logger.warning("Logo not found")
+
+        # Main web UI page (None = fall back to the legacy UI)
+        index_path = TEMPLATES_DIR / "index.html"
+        self._index_path = index_path if index_path.exists() else None
         
         # Setup routes
         self._setup_routes()
@@ -99,35 +454,30 @@ class SonoriumApp:
         # --- Web UI ---
 
         @self.app.get("/", response_class=HTMLResponse)
-        async def index():
+        async def index(request: Request):
             """Serve the main web UI."""
-            template_path = TEMPLATES_DIR / "index.html"
-            if template_path.exists():
-                return HTMLResponse(content=template_path.read_text())
+            if self._index_path:
+                # Static file: sent with sendfile, no read into Python
+                return FileResponse(self._index_path, media_type="text/html")
             else:
                 # Fallback to legacy UI
-                return await self._legacy_ui()
+                return await self._legacy_ui(request)
         
         @self.app.get("/v1", response_class=HTMLResponse)
-        async def legacy_index():
+        async def legacy_index(request: Request):
             """Serve the legacy v1 web UI."""
-            return await self._legacy_ui()
+            return await self._legacy_ui(request)
 
         # Explicit route for logo.png - more reliable than StaticFiles mount
         @self.app.get("/logo.png")
         async def serve_logo():
             """Serve the logo file."""
-            logo_paths = [
-                Path("/app/logo.png"),
-                Path(__file__).parent.parent.parent / "logo.png",
-            ]
-            for logo_path in logo_paths:
-                if logo_path.exists():
-                    logger.info(f"Serving logo from: {logo_path}")
-                    return FileResponse(logo_path, media_type="image/png")
-            logger.warning(f"Logo not found. Checked: {logo_paths}")
-            from fastapi import HTTPException
-            raise HTTPException(status_code=404, detail="Logo not found")
+            if not self._logo:
+                raise HTTPException(status_code=404, detail="Logo not found")
+            # The cached stat_result spares FileResponse a stat() per request
+            path, stat_result = self._logo
+            return FileResponse(path, media_type="image/png", stat_result=stat_result,
+                                headers={"Cache-Control": ASSET_CACHE_CONTROL})
 
         @self.app.get("/static/logo.png", response_class=FileResponse)
         async def serve_static_logo():
@@ -137,20 +487,16 @@ class SonoriumApp:
         @self.app.get("/icon.png")
         async def serve_icon():
             """Serve the icon file."""
-            icon_paths = [
-                Path("/app/icon.png"),
-                Path(__file__).parent.parent.parent / "icon.png",
-            ]
-            for icon_path in icon_paths:
-                if icon_path.exists():
-                    return FileResponse(icon_path, media_type="image/png")
-            from fastapi import HTTPException
-            raise HTTPException(status_code=404, detail="Icon not found")
+            if not self._icon:
+                raise HTTPException(status_code=404, detail="Icon not found")
+            path, stat_result = self._icon
+            return FileResponse(path, media_type="image/png", stat_result=stat_result,
+                                headers={"Cache-Control": ASSET_CACHE_CONTROL})
 
         print("[ROUTES] After icon route, before debug endpoint", flush=True)
 
         # Debug endpoint to check static files
-        @self.app.get("/debug/static")
+        @self.app.get("/debug/static", response_model=None, response_class=ORJSONResponse)
         async def debug_static():
             """Debug endpoint to check static file paths."""
             result = {
@@ -165,7 +511,7 @@ class SonoriumApp:
                     result["contents"] = [str(p.relative_to(STATIC_DIR)) for p in STATIC_DIR.rglob("*") if p.is_file()]
                 except Exception as e:
                     result["error"] = str(e)
-            return result
+            return ORJSONResponse(result)
 
         # Mount static files (CSS, JS)
         print(f"[STATIC] About to mount. STATIC_DIR={STATIC_DIR}, exists={STATIC_DIR.exists()}", flush=True)
@@ -199,165 +545,138 @@ class SonoriumApp:
         async def stream(theme_id: str):
             """Stream audio for a theme."""
             if not self.mqtt_client:
-                return {"error": "Streaming not available"}
+                return ORJSONResponse({"error": "Streaming not available"})
             
-            theme_def = self.mqtt_client.device.themes.id.get(theme_id)
+            theme_def = self._get_theme(theme_id)
             if not theme_def:
-                return {"error": f"Theme '{theme_id}' not found"}
+                return ORJSONResponse({"error": f"Theme '{theme_id}' not found"})
             
-            audio_stream = theme_def.get_stream()
-            return StreamingResponse(audio_stream, media_type="audio/mpeg")
+            # Check and take a slot with no await in between (acquire() doesn't
+            # suspend when a slot is free); the response releases it once sent
+            if self._stream_slots.locked():
+                return ORJSONResponse({"error": "Too many open streams"}, status_code=503)
+            await self._stream_slots.acquire()
+
+            try:
+                audio_stream = theme_def.get_stream()
+                return _SlotStreamingResponse(
+                    self._iterate_stream(_coalesce(audio_stream)),
+                    self._stream_slots,
+                    media_type="audio/mpeg",
+                    # Live, endless body: not cacheable and not seekable
+                    headers={"Cache-Control": "no-cache, no-store", "Accept-Ranges": "none"},
+                )
+            except BaseException:
+                self._stream_slots.release()
+                raise
         
         # --- Theme API (for web UI) ---
 
-        @self.app.get("/api/themes")
+        @self.app.get("/api/themes", response_model=None, response_class=ORJSONResponse)
         async def list_themes():
             """List all available themes with metadata, including empty folders."""
-            import json
-
-            # Get favorites from state if available
-            favorites = []
-            if self._state_store:
-                favorites = self._state_store.settings.favorite_themes
-
-            themes = []
-            seen_folders = set()
-
-            # First, add themes loaded by the device (have audio files)
-            if self.mqtt_client:
-                for theme in self.mqtt_client.device.themes:
-                    enabled_count = sum(1 for i in theme.instances if i.is_enabled)
-
-                    # Try to read metadata.json from theme folder
-                    metadata = self._read_theme_metadata(theme.id)
-
-                    # Track the actual folder name
-                    theme_folder = self._find_theme_folder(theme.id)
-                    if theme_folder:
-                        seen_folders.add(theme_folder.name)
-
-                    themes.append({
-                        "id": theme.id,
-                        "name": theme.name,
-                        "total_tracks": len(theme.instances),
-                        "enabled_tracks": enabled_count,
-                        "url": theme.url,
-                        "description": metadata.get("description", ""),
-                        "icon": metadata.get("icon", ""),
-                        "is_favorite": theme.id in favorites,
-                        "has_audio": True,
-                    })
-
-            # Then scan for empty theme folders
-            media_paths = [
-                Path("/media/sonorium"),
-                Path("/share/sonorium"),
-            ]
-
-            audio_extensions = {'.mp3', '.wav', '.flac', '.ogg'}
-
-            for mp in media_paths:
-                if not mp.exists():
-                    continue
+            # Scans the media folders and reads metadata.json files, so run it off the loop
+            return ORJSONResponse(await asyncio.to_thread(self._list_themes))
 
-                for folder in mp.iterdir():
-                    if not folder.is_dir() or folder.name in seen_folders:
-                        continue
-
-                    # Count audio files in this folder
-                    audio_files = [f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in audio_extensions]
-
-                    # Skip if it has audio (already added above)
-                    if audio_files:
-                        continue
-
-                    # Generate sanitized ID like ThemeDefinition does
-                    sanitized_id = folder.name.lower().replace(' ', '-').replace('_', '-')
-                    sanitized_id = ''.join(c for c in sanitized_id if c.isalnum() or c == '-')
-                    while '--' in sanitized_id:
-                        sanitized_id = sanitized_id.replace('--', '-')
-                    sanitized_id = sanitized_id.strip('-')
-
-                    # Read metadata if exists
-                    metadata = {}
-                    meta_path = folder / "metadata.json"
-                    if meta_path.exists():
-                        try:
-                            metadata = json.loads(meta_path.read_text())
-                        except Exception:
-                            pass
-
-                    themes.append({
-                        "id": sanitized_id,
-                        "name": folder.name,
-                        "total_tracks": 0,
-                        "enabled_tracks": 0,
-                        "url": "",
-                        "description": metadata.get("description", ""),
-                        "icon": metadata.get("icon", ""),
-                        "is_favorite": sanitized_id in favorites,
-                        "has_audio": False,
-                    })
-
-            return themes
-        
-        @self.app.get("/api/themes/{theme_id}")
+        @self.app.get("/api/themes/{theme_id}", response_model=None, response_class=ORJSONResponse)
         async def get_theme(theme_id: str):
             """Get theme details."""
             if not self.mqtt_client:
-                return {"error": "Not available"}
+                return ORJSONResponse({"error": "Not available"})
             
-            theme = self.mqtt_client.device.themes.id.get(theme_id)
+            theme = self._get_theme(theme_id)
             if not theme:
-                return {"error": "Theme not found"}
-            
-            return {
-                "id": theme.id,
-                "name": theme.name,
-                "total_tracks": len(theme.instances),
-                "enabled_tracks": sum(1 for i in theme.instances if i.is_enabled),
-                "url": theme.url,
-                "tracks": [
-                    {"name": i.name, "enabled": i.is_enabled}
-                    for i in theme.instances
-                ],
-            }
+                return ORJSONResponse({"error": "Theme not found"})
+
+            # Re-encode only when the theme was reloaded or a track was toggled
+            cached = self._theme_json_cache.get(theme_id)
+            if cached is None or cached[0] is not theme or cached[1] != theme.revision:
+                cached = (theme, theme.revision, orjson.dumps({
+                    "id": theme.id,
+                    "name": theme.name,
+                    "total_tracks": len(theme.instances),
+                    "enabled_tracks": theme.enabled_count,
+                    "url": theme.url,
+                    "tracks": [
+                        {"name": i.name, "enabled": i.is_enabled}
+                        for i in theme.instances
+                    ],
+                }))
+                self._theme_json_cache[theme_id] = cached
+            return Response(content=cached[2], media_type="application/json")
         
         # --- Legacy v1 API endpoints ---
         
-        @self.app.post("/api/enable_all/{theme_id}")
+        @self.app.post("/api/enable_all/{theme_id}", response_model=None, response_class=ORJSONResponse)
         async def enable_all(theme_id: str):
             """Enable all recordings in a theme."""
             if not self.mqtt_client:
-                return {"error": "Not available"}
+                return ORJSONResponse({"error": "Not available"})
             
-            theme = self.mqtt_client.device.themes.id.get(theme_id)
+            theme = self._get_theme(theme_id)
             if not theme:
-                return {"error": "Theme not found"}
+                return ORJSONResponse({"error": "Theme not found"})
             
             for instance in theme.instances:
                 instance.is_enabled = True
-            return {"status": "ok", "theme": theme_id, "enabled": len(theme.instances)}
+            return ORJSONResponse({"status": "ok", "theme": theme_id, "enabled": len(theme.instances)})
         
-        @self.app.post("/api/disable_all/{theme_id}")
+        @self.app.post("/api/disable_all/{theme_id}", response_model=None, response_class=ORJSONResponse)
         async def disable_all(theme_id: str):
             """Disable all recordings in a theme."""
             if not self.mqtt_client:
-                return {"error": "Not available"}
+                return ORJSONResponse({"error": "Not available"})
             
-            theme = self.mqtt_client.device.themes.id.get(theme_id)
+            theme = self._get_theme(theme_id)
             if not theme:
-                return {"error": "Theme not found"}
+                return ORJSONResponse({"error": "Theme not found"})
             
             for instance in theme.instances:
                 instance.is_enabled = False
-            return {"status": "ok", "theme": theme_id, "disabled": len(theme.instances)}
+            return ORJSONResponse({"status": "ok", "theme": theme_id, "disabled": len(theme.instances)})
 
-        @self.app.post("/api/themes/{theme_id}/favorite")
+        @self.app.post("/api/batch", response_model=None, response_class=ORJSONResponse)
+        async def batch(request: Request):
+            """
+            Apply several enable_all/disable_all operations in one request.
+
+            Body: [{"op": "enable_all", "theme_id": "..."}, ...]. Returns one result
+            per operation, shaped like the single-theme endpoints' responses.
+            """
+            if not self.mqtt_client:
+                return ORJSONResponse({"error": "Not available"})
+
+            try:
+                operations = orjson.loads(await request.body())
+            except Exception:
+                return ORJSONResponse({"error": "Invalid JSON body"})
+            if not isinstance(operations, list):
+                return ORJSONResponse({"error": "Expected a list of operations"})
+
+            results = []
+            for operation in operations:
+                op = operation.get("op") if isinstance(operation, dict) else None
+                theme_id = operation.get("theme_id") if isinstance(operation, dict) else None
+                if op not in _BATCH_OPS:
+                    results.append({"error": f"Unknown operation '{op}'"})
+                    continue
+                theme = self._get_theme(theme_id)
+                if not theme:
+                    results.append({"error": "Theme not found", "theme": theme_id})
+                    continue
+
+                key, enabled = _BATCH_OPS[op]
+                for instance in theme.instances:
+                    instance.is_enabled = enabled
+                results.append({"status": "ok", "theme": theme_id, key: len(theme.instances)})
+
+            return ORJSONResponse({"results": results})
+
+        @self.app.post("/api/themes/{theme_id}/favorite", response_model=None, response_class=ORJSONResponse)
         async def toggle_favorite(theme_id: str):
             """Toggle favorite status for a theme."""
             if not self._state_store:
-                return {"error": "State not available"}
+                return ORJSONResponse({"error": "State not available"})
 
             favorites = self._state_store.settings.favorite_themes
             if theme_id in favorites:
@@ -367,59 +686,68 @@ class SonoriumApp:
                 favorites.append(theme_id)
                 is_favorite = True
 
-            self._state_store.save()
-            return {"theme_id": theme_id, "is_favorite": is_favorite}
+            self._state_store.schedule_save()
+            return ORJSONResponse({"theme_id": theme_id, "is_favorite": is_favorite})
 
-        @self.app.put("/api/themes/{theme_id}/metadata")
+        @self.app.put("/api/themes/{theme_id}/metadata", response_model=None, response_class=ORJSONResponse)
         async def update_metadata(theme_id: str, request: Request):
             """Update theme metadata (description, etc.)."""
             if not self.mqtt_client:
-                return {"error": "Not available"}
+                return ORJSONResponse({"error": "Not available"})
 
-            theme = self.mqtt_client.device.themes.id.get(theme_id)
+            theme = self._get_theme(theme_id)
             if not theme:
-                return {"error": "Theme not found"}
+                return ORJSONResponse({"error": "Theme not found"})
 
             # Parse JSON body
             try:
-                body = await request.json()
+                body = orjson.loads(await request.body())
             except Exception:
-                return {"error": "Invalid JSON body"}
+                return ORJSONResponse({"error": "Invalid JSON body"})
 
             # Read existing metadata and merge
-            metadata = self._read_theme_metadata(theme_id)
+            metadata = await asyncio.to_thread(self._read_theme_metadata, theme_id)
             if "description" in body:
                 metadata["description"] = body["description"]
 
             # Write back
-            if self._write_theme_metadata(theme_id, metadata):
-                return {"status": "ok", "metadata": metadata}
-            return {"error": "Could not write metadata"}
+            if await asyncio.to_thread(self._write_theme_metadata, theme_id, metadata):
+                return ORJSONResponse({"status": "ok", "metadata": metadata})
+            return ORJSONResponse({"error": "Could not write metadata"})
 
         # Note: Theme create, upload, delete, and metadata update are now in api_v2.py
 
-        @self.app.get("/api/status")
+        @self.app.get("/api/status", response_model=None, response_class=ORJSONResponse)
         async def status():
             """Get current status."""
             if not self.mqtt_client:
-                return {"version": __version__, "themes": []}
+                return ORJSONResponse({"version": __version__, "themes": []})
             
             device = self.mqtt_client.device
-            themes_data = []
-            for theme in device.themes:
-                enabled_count = sum(1 for i in theme.instances if i.is_enabled)
-                themes_data.append({
-                    "name": theme.name,
-                    "id": theme.id,
-                    "total_tracks": len(theme.instances),
-                    "enabled_tracks": enabled_count,
-                    "url": theme.url,
-                })
-            return {
-                "version": __version__,
-                "current_theme": device.themes.current.name if device.themes.current else None,
-                "themes": themes_data,
-            }
+            themes = device.themes
+
+            # Polled endpoint: re-encode only when the theme list, the current
+            # theme or an enabled flag changed
+            key = (themes, len(themes), themes.current, RecordingThemeInstance.revision)
+            cached = self._status_cache
+            if cached is None or cached[0] != key:
+                themes_data = [
+                    ThemeStatus(
+                        name=theme.name,
+                        id=theme.id,
+                        total_tracks=len(theme.instances),
+                        enabled_tracks=theme.enabled_count,
+                        url=theme.url,
+                    )
+                    for theme in themes
+                ]
+                cached = (key, orjson.dumps({
+                    "version": __version__,
+                    "current_theme": themes.current.name if themes.current else None,
+                    "themes": themes_data,
+                }))
+                self._status_cache = cached
+            return Response(content=cached[1], media_type="application/json")
     
     def initialize_v2(self, settings=None):
         """
@@ -446,23 +774,23 @@ class SonoriumApp:
             self._state_store.load()
             
             # Initialize HA registry
-            api_url = f"{settings.ha_supervisor_api.replace('/core', '')}/core/api"
-            self._ha_registry = HARegistry(api_url, settings.token)
+            self._api_url = f"{settings.ha_supervisor_api.replace('/core', '')}/core/api"
+            self._ha_registry = HARegistry(self._api_url, settings.token)
             self._ha_registry.refresh()
             
             # Initialize media controller
-            self._media_controller = HAMediaController(api_url, settings.token)
+            self._media_controller = HAMediaController(self._api_url, settings.token)
             
             # Determine stream base URL
             # In addon context, this should be the addon's external URL
-            stream_base_url = f"http://localhost:{settings.port if hasattr(settings, 'port') else 8080}"
+            self._stream_base_url = f"http://localhost:{settings.port if hasattr(settings, 'port') else 8080}"
             
             # Initialize managers
             self._session_manager = SessionManager(
                 self._state_store,
                 self._ha_registry,
                 self._media_controller,
-                stream_base_url,
+                self._stream_base_url,
             )
             
             self._group_manager = GroupManager(
@@ -482,7 +810,6 @@ class SonoriumApp:
 
                 self._plugin_manager = PluginManager(self._state_store, audio_path=audio_path)
                 # Note: Plugin initialization is async, so we start it in background
-                import asyncio
                 asyncio.create_task(self._plugin_manager.initialize())
                 logger.info(f"Plugin manager created with audio_path={audio_path}, initialization started")
             except Exception as e:
@@ -496,6 +823,8 @@ class SonoriumApp:
                 ha_registry=self._ha_registry,
                 state_store=self._state_store,
                 plugin_manager=self._plugin_manager,
+                # Creating a theme may create the first media root
+                on_themes_changed=self.refresh_media_roots,
             )
             self.app.include_router(api_router)
 
@@ -506,263 +835,317 @@ class SonoriumApp:
             logger.error(f"Failed to initialize v2 components: {e}")
             # Continue with v1 functionality only
 
-    def _find_theme_folder(self, theme_id: str) -> Path | None:
-        """Find theme folder by ID, handling sanitized names."""
-        media_paths = [
-            Path("/media/sonorium"),
-            Path("/share/sonorium"),
-        ]
+    def _get_theme(self, theme_id: str):
+        """
+        Look up a loaded theme by ID.
 
-        for mp in media_paths:
-            if not mp.exists():
+        `device.themes.id` builds a fresh dict (computing every theme's ID) on each
+        access, so keep one and rebuild it only when the theme list is replaced or grows.
+        """
+        themes = self.mqtt_client.device.themes
+        index = self._theme_index
+        if index is None or index[0] is not themes or index[1] != len(themes):
+            index = (themes, len(themes), {theme.id: theme for theme in themes})
+            self._theme_index = index
+        return index[2].get(theme_id)
+
+    def _list_themes(self) -> list[ThemeListing]:
+        """Build the /api/themes payload (blocking: touches the filesystem)."""
+        # Get favorites from state if available
+        favorites = set()
+        if self._state_store:
+            favorites = set(self._state_store.settings.favorite_themes)
+
+        themes = []
+        seen_folders = set()
+
+        # First, add themes loaded by the device (have audio files)
+        if self.mqtt_client:
+            for theme in self.mqtt_client.device.themes:
+                enabled_count = theme.enabled_count
+
+                # Track the actual folder name and read its metadata.json
+                metadata = {}
+                theme_folder = self._find_theme_folder(theme.id)
+                if theme_folder:
+                    seen_folders.add(theme_folder.name)
+                    metadata = self._load_metadata(theme_folder)
+
+                themes.append(ThemeListing(
+                    id=theme.id,
+                    name=theme.name,
+                    total_tracks=len(theme.instances),
+                    enabled_tracks=enabled_count,
+                    url=theme.url,
+                    description=metadata.get("description", ""),
+                    icon=metadata.get("icon", ""),
+                    is_favorite=theme.id in favorites,
+                    has_audio=True,
+                ))
+
+        # Then the folders the device didn't load, if they hold no audio yet
+        for mp in self._roots():
+            index = self._folder_index(mp)
+            if index is None:
                 continue
 
-            # Try exact match first
-            exact_path = mp / theme_id
-            if exact_path.exists():
-                return exact_path
+            for folder_name, folder in index[0].items():
+                # Skip folders already listed above, and unloaded ones that hold audio
+                if folder_name in seen_folders or self._has_audio(folder):
+                    continue
+
+                # Generate sanitized ID like ThemeDefinition does
+                sanitized_id = _sanitize_theme_id(folder_name)
+
+                metadata = self._load_metadata(folder)
+
+                themes.append(ThemeListing(
+                    id=sanitized_id,
+                    name=folder_name,
+                    total_tracks=0,
+                    enabled_tracks=0,
+                    url="",
+                    description=metadata.get("description", ""),
+                    icon=metadata.get("icon", ""),
+                    is_favorite=sanitized_id in favorites,
+                    has_audio=False,
+                ))
+
+        return themes
+
+    def refresh_media_roots(self):
+        """Re-probe which of MEDIA_PATHS exist (e.g. after mounting or creating one)."""
+        self._media_roots = tuple(mp for mp in MEDIA_PATHS if mp.is_dir())
+        self._media_roots_probed = time.monotonic()
+        logger.debug(f"Theme media roots: {self._media_roots}")
+
+    def _roots(self) -> tuple[Path, ...]:
+        """The existing media roots, re-probing now and then while any are missing."""
+        if (len(self._media_roots) < len(MEDIA_PATHS)
+                and time.monotonic() - self._media_roots_probed >= MEDIA_ROOT_REPROBE_SECONDS):
+            self.refresh_media_roots()
+        return self._media_roots
+
+    def _folder_index(self, mp: Path) -> tuple[dict, dict] | None:
+        """
+        Index a media root's sub-folders as ({folder name: path}, {sanitized ID: path}).
 
-            # Try to find by comparing sanitized folder names
-            for folder in mp.iterdir():
-                if folder.is_dir():
+        Adding, removing or renaming a folder bumps the root's mtime, so the index is
+        rebuilt only then. Returns None if the root doesn't exist.
+        """
+        try:
+            mtime = mp.stat().st_mtime_ns
+        except OSError:
+            # The root went away: drop it from the probed roots
+            self._folder_cache.pop(mp, None)
+            self.refresh_media_roots()
+            return None
+        cached = self._folder_cache.get(mp)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        by_name = {}
+        by_id = {}
+        with os.scandir(mp) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    path = Path(entry.path)
+                    by_name[entry.name] = path
                     # Sanitize the folder name the same way ThemeDefinition does
-                    sanitized = folder.name.lower().replace(' ', '-').replace('_', '-')
-                    # Remove non-alphanumeric except dashes
-                    sanitized = ''.join(c for c in sanitized if c.isalnum() or c == '-')
-                    # Collapse multiple dashes
-                    while '--' in sanitized:
-                        sanitized = sanitized.replace('--', '-')
-                    sanitized = sanitized.strip('-')
+                    by_id.setdefault(_sanitize_theme_id(entry.name), path)
+        index = (by_name, by_id)
+        self._folder_cache[mp] = (mtime, index)
+        return index
 
-                    if sanitized == theme_id or sanitized == theme_id.replace('_', '-'):
-                        return folder
+    def _has_audio(self, folder: Path) -> bool:
+        """
+        Whether a theme folder contains any audio file.
+
+        Adding or removing files bumps the folder's mtime, so the scan (which stops
+        at the first audio file) is redone only then; otherwise this is one stat().
+        """
+        try:
+            mtime = folder.stat().st_mtime_ns
+        except OSError:
+            return False
+        cached = self._audio_cache.get(folder)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with os.scandir(folder) as files:
+            has_audio = any(
+                os.path.splitext(f.name)[1].lower() in AUDIO_EXTENSIONS and f.is_file() for f in files
+            )
+        self._audio_cache[folder] = (mtime, has_audio)
+        return has_audio
+
+    def _find_theme_folder(self, theme_id: str) -> Path | None:
+        """Find theme folder by ID, handling sanitized names."""
+        for mp in self._roots():
+            index = self._folder_index(mp)
+            if index is None:
+                continue
+            by_name, by_id = index
+
+            # Exact folder name first, then sanitized folder names
+            folder = by_name.get(theme_id) or by_id.get(theme_id) or by_id.get(theme_id.replace('_', '-'))
+            if folder:
+                return folder
 
         return None
 
+    def _load_metadata(self, folder: Path) -> dict:
+        """
+        Parsed metadata.json of a theme folder ({} if missing or invalid).
+
+        Parses are cached by the file's mtime, so unchanged files cost one stat().
+        The returned dict is shared with the cache and must not be mutated.
+        """
+        meta_path = folder / "metadata.json"
+        try:
+            mtime = meta_path.stat().st_mtime_ns
+        except OSError:
+            self._meta_cache.pop(meta_path, None)
+            return {}
+        cached = self._meta_cache.get(meta_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            metadata = orjson.loads(meta_path.read_bytes())
+        except Exception as e:
+            logger.debug(f"Failed to read metadata from {meta_path}: {e}")
+            metadata = {}
+        if not isinstance(metadata, dict):
+            metadata = {}
+        self._meta_cache[meta_path] = (mtime, metadata)
+        return metadata
+
     def _read_theme_metadata(self, theme_id: str) -> dict:
-        """Read metadata.json from a theme folder."""
-        import json
+        """Read metadata.json from a theme folder (a private copy, safe to modify)."""
         theme_folder = self._find_theme_folder(theme_id)
         if theme_folder:
-            meta_path = theme_folder / "metadata.json"
-            if meta_path.exists():
-                try:
-                    return json.loads(meta_path.read_text())
-                except Exception as e:
-                    logger.debug(f"Failed to read metadata from {meta_path}: {e}")
+            return dict(self._load_metadata(theme_folder))
         return {}
 
     def _write_theme_metadata(self, theme_id: str, metadata: dict) -> bool:
         """Write metadata.json to a theme folder."""
-        import json
         theme_folder = self._find_theme_folder(theme_id)
         if theme_folder:
             try:
                 meta_path = theme_folder / "metadata.json"
-                meta_path.write_text(json.dumps(metadata, indent=2))
+                self._meta_cache.pop(meta_path, None)
+                meta_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
                 return True
             except Exception as e:
                 logger.error(f"Failed to write metadata to {meta_path}: {e}")
         return False
 
-    async def _legacy_ui(self):
+    async def _legacy_ui(self, request: Request):
         """Generate the legacy v1 web UI."""
         if not self.mqtt_client:
             return HTMLResponse("<h1>Sonorium</h1><p>Initializing...</p>")
         
         device = self.mqtt_client.device
         themes = device.themes
-        
-        # Build theme cards
-        theme_cards = ""
+
+        # The page only changes when the theme list, the current theme or an
+        # enabled flag does; it is polled every 10s by each open browser
+        revision = RecordingThemeInstance.revision
+        cached = self._legacy_html_cache
+        if cached is not None and cached[0] is themes and cached[1] is themes.current and cached[2] == revision:
+            return self._legacy_response(request, cached)
+
+        # Build theme cards (fragments joined once, rather than += in the loops)
+        theme_cards = []
         for theme in themes:
-            enabled_count = sum(1 for inst in theme.instances if inst.is_enabled)
+            enabled_count = theme.enabled_count
             total = len(theme.instances)
             is_current = theme == themes.current
             current_class = "current" if is_current else ""
             
-            recordings_list = ""
-            for inst in theme.instances:
-                status = "✓" if inst.is_enabled else "○"
-                status_class = "enabled" if inst.is_enabled else "disabled"
-                recordings_list += f'<div class="rec {status_class}"><span class="status">{status}</span> {inst.name}</div>'
+            # Names come from folder/file names: escape them. The ID goes into a JS
+            # string inside an attribute, so JSON-encode it and then escape that.
+            recordings_list = "".join(
+                f'<div class="rec enabled"><span class="status">✓</span> {html.escape(inst.name)}</div>'
+                if inst.is_enabled else
+                f'<div class="rec disabled"><span class="status">○</span> {html.escape(inst.name)}</div>'
+                for inst in theme.instances
+            )
+            js_id = html.escape(orjson.dumps(theme.id).decode())
             
-            theme_cards += f'''
+            theme_cards.append(f'''
             <div class="theme-card {current_class}">
                 <div class="theme-header">
-                    <h3>{theme.name}</h3>
+                    <h3>{html.escape(theme.name)}</h3>
                     <span class="track-count">{enabled_count}/{total} enabled</span>
                 </div>
                 <div class="recordings">{recordings_list}</div>
                 <div class="theme-actions">
-                    <button onclick="enableAll('{theme.id}')">Enable All</button>
-                    <button onclick="disableAll('{theme.id}')" class="secondary">Disable All</button>
-                    <button onclick="playTheme('{theme.id}')" class="play">▶ Play</button>
+                    <button onclick="enableAll({js_id})">Enable All</button>
+                    <button onclick="disableAll({js_id})" class="secondary">Disable All</button>
+                    <button onclick="playTheme({js_id})" class="play">▶ Play</button>
                 </div>
-                <div class="stream-url">Stream: {theme.url}</div>
+                <div class="stream-url">Stream: {html.escape(theme.url)}</div>
             </div>
-            '''
-        
-        html = f'''<!DOCTYPE html>
-<html>
-<head>
-    <title>Sonorium {__version__}</title>
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <meta http-equiv="refresh" content="10">
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{ 
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            color: #eee;
-            margin: 0;
-            padding: 20px;
-            min-height: 100vh;
-        }}
-        .container {{ max-width: 800px; margin: 0 auto; }}
-        h1 {{ 
-            color: #00d4ff;
-            text-align: center;
-            margin-bottom: 10px;
-        }}
-        .subtitle {{
-            text-align: center;
-            color: #888;
-            margin-bottom: 30px;
-        }}
-        .version-switch {{
-            text-align: center;
-            margin-bottom: 20px;
-        }}
-        .version-switch a {{
-            color: #00d4ff;
-            text-decoration: none;
-        }}
-        .theme-card {{
-            background: rgba(255,255,255,0.08);
-            border-radius: 12px;
-            padding: 20px;
-            margin-bottom: 20px;
-            border: 2px solid transparent;
-        }}
-        .theme-card.current {{
-            border-color: #00d4ff;
-        }}
-        .theme-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }}
-        .theme-header h3 {{
-            margin: 0;
-            color: #fff;
-        }}
-        .track-count {{
-            color: #00d4ff;
-            font-size: 14px;
-        }}
-        .recordings {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
-            gap: 8px;
-            margin-bottom: 15px;
-            max-height: 200px;
-            overflow-y: auto;
-        }}
-        .rec {{
-            padding: 6px 10px;
-            background: rgba(0,0,0,0.3);
-            border-radius: 6px;
-            font-size: 12px;
-            white-space: nowrap;
-            overflow: hidden;
-            text-overflow: ellipsis;
-        }}
-        .rec.enabled {{ color: #00ff88; }}
-        .rec.disabled {{ color: #666; }}
-        .rec .status {{ margin-right: 5px; }}
-        .theme-actions {{
-            display: flex;
-            gap: 10px;
-        }}
-        button {{
-            padding: 10px 16px;
-            border: none;
-            border-radius: 8px;
-            font-size: 14px;
-            cursor: pointer;
-            background: #00d4ff;
-            color: #000;
-            font-weight: bold;
-        }}
-        button:hover {{ opacity: 0.9; }}
-        button.secondary {{
-            background: rgba(255,255,255,0.2);
-            color: #fff;
-        }}
-        button.play {{
-            background: #00ff88;
-            flex: 1;
-        }}
-        .stream-url {{
-            margin-top: 10px;
-            font-size: 11px;
-            color: #666;
-            font-family: monospace;
-        }}
-        .status-msg {{
-            position: fixed;
-            bottom: 20px;
-            left: 50%;
-            transform: translateX(-50%);
-            background: #00d4ff;
-            color: #000;
-            padding: 10px 20px;
-            border-radius: 8px;
-            display: none;
-        }}
-        .status-msg.show {{ display: block; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🎵 Sonorium {__version__}</h1>
-        <p class="subtitle">Ambient Soundscape Mixer • Auto-refreshes every 10s</p>
-        <p class="version-switch"><a href="/">→ Try the new v2 UI with multi-zone support</a></p>
-        {theme_cards}
-    </div>
-    <div class="status-msg" id="status"></div>
-    
-    <script>
-        function showStatus(msg) {{
-            const el = document.getElementById('status');
-            el.textContent = msg;
-            el.classList.add('show');
-            setTimeout(() => el.classList.remove('show'), 2000);
-        }}
-        
-        async function enableAll(themeId) {{
-            await fetch('/api/enable_all/' + themeId, {{method: 'POST'}});
-            showStatus('All recordings enabled!');
-            setTimeout(() => location.reload(), 500);
-        }}
-        
-        async function disableAll(themeId) {{
-            await fetch('/api/disable_all/' + themeId, {{method: 'POST'}});
-            showStatus('All recordings disabled');
-            setTimeout(() => location.reload(), 500);
-        }}
+            ''')
         
-        function playTheme(themeId) {{
-            window.open('/stream/' + themeId, '_blank');
-            showStatus('Opening audio stream...');
-        }}
-    </script>
-</body>
-</html>'''
-        return HTMLResponse(content=html)
+        page = _LEGACY_PAGE.substitute(version=__version__, theme_cards="".join(theme_cards))
+        content = page.encode()
+        # Compressed once per render; the compression middleware passes
+        # responses that already carry a Content-Encoding through untouched
+        # Weak ETag: the plain and gzipped bodies are the same page
+        etag = 'W/"' + hashlib.blake2b(content, digest_size=8).hexdigest() + '"'
+        cached = (themes, themes.current, revision, content, gzip.compress(content, compresslevel=6), etag)
+        self._legacy_html_cache = cached
+        return self._legacy_response(request, cached)
+
+    @staticmethod
+    def _legacy_response(request: Request, cached: tuple) -> HTMLResponse:
+        """Serve the cached legacy UI, gzipped when the client accepts it (304 if unchanged)."""
+        headers = {"ETag": cached[5], "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if cached[5] in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        if accepts_gzip(request.headers.get("accept-encoding", "")):
+            headers["Content-Encoding"] = "gzip"
+            return HTMLResponse(content=cached[4], headers=headers)
+        return HTMLResponse(content=cached[3], headers=headers)
     
+    async def _iterate_stream(self, chunks):
+        """
+        Pull chunks from a blocking audio iterator on the stream executor.
+
+        A producer task keeps up to STREAM_READ_AHEAD chunks buffered ahead of the client.
+        """
+        loop = asyncio.get_running_loop()
+        buffer = asyncio.Queue(maxsize=STREAM_READ_AHEAD)
+        end = object()
+
+        async def produce():
+            try:
+                while (chunk := await loop.run_in_executor(self._stream_executor, next, chunks, end)) is not end:
+                    await buffer.put(chunk)
+            except Exception as e:
+                # Re-raised on the response side
+                await buffer.put(e)
+            else:
+                await buffer.put(end)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (chunk := await buffer.get()) is not end:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            producer.cancel()
+
+    async def _shutdown(self):
+        """Write any debounced state save before the process exits."""
+        if self._state_store:
+            await self._state_store.flush()
+        self._stream_executor.shutdown(wait=False, cancel_futures=True)
+
     # Properties for accessing components
     
     @property
@@ -796,6 +1179,7 @@ def create_app(mqtt_client=None) -> FastAPI:
     Returns:
         Configured FastAPI application
     """
+    logging.config.dictConfig(LOGGING_CONFIG)
     sonorium = SonoriumApp(mqtt_client)
     return sonorium.app
 
@@ -804,4 +1188,7 @@ def create_app(mqtt_client=None) -> FastAPI:
 if __name__ == "__main__":
     import uvicorn
     app = create_app()
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # loop/http default to "auto": uvloop and httptools are picked up when installed.
+    # Single process on purpose: sessions, live streams, the MQTT client and the
+    # state file writer are per-process, so multiple workers would diverge.
+    uvicorn.run(app, host="0.0.0.0", port=8080, access_log=False, server_header=False, log_config=LOGGING_CONFIG)
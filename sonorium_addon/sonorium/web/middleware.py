@@ -0,0 +1,62 @@
+"""
+Sonorium HTTP Middleware
+
+Response compression for the JSON API and web UI. Audio endpoints are
+excluded: MP3 does not compress, and the live streams are endless bodies
+that must reach the speakers without being buffered by the compressor.
+"""
+
+from __future__ import annotations
+
+from fastapi.middleware.gzip import GZipMiddleware
+
+
+# Responses smaller than this are sent uncompressed
+GZIP_MINIMUM_SIZE = 1024
+
+# Path prefixes/suffixes that serve audio and must never be compressed
+STREAM_PATH_PREFIXES = ("/stream",)
+STREAM_PATH_SUFFIXES = ("/audio",)
+
+
+class JSONGZipMiddleware(GZipMiddleware):
+    """GZip middleware that passes audio streams through untouched."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path.startswith(STREAM_PATH_PREFIXES) or path.endswith(STREAM_PATH_SUFFIXES):
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header value allows a gzip response.
+
+    Honours q-values, so "gzip;q=0" refuses gzip; a "*" entry covers gzip when
+    gzip itself isn't listed.
+    """
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard = q > 0
+    return wildcard
+
+
+def add_compression(app) -> None:
+    """Enable gzip compression for API/UI responses on a FastAPI app."""
+    app.add_middleware(JSONGZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
@@ -0,0 +1,86 @@
+"""
+API v2 Response Model Tests
+
+The session, group and cycle-config responses are built with
+model_construct(), which skips Pydantic validation. These tests build them
+from known-good internal objects and check that the result dumps exactly
+like the same data run through model_validate().
+
+Run with: python -m pytest tests/test_api_v2_responses.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'sonorium_addon'))
+
+api_v2 = pytest.importorskip("sonorium.web.api_v2")
+
+from sonorium.core.state import CycleConfig, NameSource, Session, SpeakerGroup, SpeakerSelection
+
+
+class SessionManagerStandIn:
+    """The session-manager lookups _session_to_response makes, with fixed answers."""
+
+    def get_resolved_speakers(self, session):
+        return ["media_player.kitchen", "media_player.lounge"]
+
+    def get_speaker_summary(self, session):
+        return "Kitchen + 1 more"
+
+    def get_session_channel(self, session_id):
+        return 2
+
+
+def assert_matches_validated(model):
+    """model (built by model_construct) must dump the same as a validated copy."""
+    dumped = model.model_dump()
+    assert set(dumped) == set(type(model).model_fields)
+    assert type(model).model_validate(dumped).model_dump() == dumped
+
+
+def test_default_cycle_response_matches_validated():
+    assert_matches_validated(api_v2._cycle_config_to_response(None))
+
+
+def test_cycle_response_matches_validated():
+    config = CycleConfig(enabled=True, interval_minutes=15, randomize=True, theme_ids=["rain", "forest"])
+    response = api_v2._cycle_config_to_response(config)
+    assert_matches_validated(response)
+    assert response.theme_ids == ["rain", "forest"]
+
+
+def test_session_response_matches_validated():
+    session = Session(
+        id="s1",
+        name="Kitchen",
+        name_source=NameSource.CUSTOM,
+        theme_id="rain",
+        adhoc_selection=SpeakerSelection(include_areas=["kitchen"]),
+        volume=40,
+        is_playing=True,
+        cycle_config=CycleConfig(enabled=True, interval_minutes=30, theme_ids=["rain"]),
+        last_played_at="2024-01-01T00:00:00",
+    )
+    response = api_v2._session_to_response(session, SessionManagerStandIn())
+    assert_matches_validated(response)
+    assert response.model_dump()["adhoc_selection"] == session.adhoc_selection.to_dict()
+
+
+def test_session_response_without_optionals_matches_validated():
+    session = Session(id="s2", name="Lounge")
+    assert_matches_validated(api_v2._session_to_response(session, SessionManagerStandIn()))
+
+
+def test_group_response_matches_validated():
+    group = SpeakerGroup(
+        id="g1",
+        name="Downstairs",
+        include_floors=["ground"],
+        include_speakers=["media_player.porch"],
+        exclude_areas=["garage"],
+    )
+    bundle = (["media_player.kitchen", "media_player.porch"], 2, "Kitchen + 1 more")
+    assert_matches_validated(api_v2._group_to_response(group, bundle))
@@ -0,0 +1,52 @@
+"""
+API v2 Settings Response Tests
+
+_settings_to_dict pairs _SETTINGS_FIELDS with values read off
+SonoriumSettings by position. These tests keep the field list, the
+SettingsResponse schema and SonoriumSettings in step, so an added or
+reordered field can't pair a value with the wrong key.
+
+Run with: python -m pytest tests/test_api_v2_settings.py
+"""
+
+import os
+import sys
+from dataclasses import fields
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'sonorium_addon'))
+
+api_v2 = pytest.importorskip("sonorium.web.api_v2")
+
+from sonorium.core.state import SonoriumSettings
+
+
+def test_settings_fields_match_response_schema():
+    assert api_v2._SETTINGS_FIELDS == tuple(f.name for f in fields(api_v2.SettingsResponse))
+
+
+def test_settings_fields_exist_on_sonorium_settings():
+    settings_fields = {f.name for f in fields(SonoriumSettings)}
+    missing = [name for name in api_v2._SETTINGS_FIELDS if name not in settings_fields]
+    assert not missing
+
+
+def test_settings_to_dict_pairs_each_value_with_its_field():
+    # Distinct non-default values, so a mispaired key shows up as a wrong value
+    settings = SonoriumSettings(
+        default_volume=41,
+        crossfade_duration=2.5,
+        max_groups=7,
+        entity_prefix="test_prefix",
+        show_in_sidebar=False,
+        auto_create_quick_play=False,
+        master_gain=77,
+        default_cycle_interval=13,
+        default_cycle_randomize=True,
+        version=5,
+    )
+    result = api_v2._settings_to_dict(settings)
+    assert list(result) == list(api_v2._SETTINGS_FIELDS)
+    for name, value in result.items():
+        assert value == getattr(settings, name)